@@ -10,35 +10,191 @@ existing MTA GTFS client to serve data to Arduino devices.
 Requirements:
     - Flask web framework
     - Existing mta_gtfs_client module
+    - orjson (optional, for faster JSON responses)
+    - waitress (optional, production WSGI server)
+    - flask-compress (optional, gzip response compression)
 
 Usage:
     python example_web_server.py
+    DEV=1 python example_web_server.py  # Flask debug server
     
 Then configure Arduino to use:
     http://YOUR_IP:5000/api/trains
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
 from datetime import datetime
+import functools
+import hashlib
+import importlib.util
+import re
 import sys
 import os
+import threading
+import time
 
 # Add parent directory to path to import from src
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+# The GTFS client and protobuf modules are only imported on the first
+# /api/trains request (see get_mta_client), so only check they exist here
+GTFS_AVAILABLE = importlib.util.find_spec("src.mta_gtfs_client") is not None
+if not GTFS_AVAILABLE:
+    print("Warning: GTFS client not available. Using mock data.")
+
 try:
-    from src.mta_gtfs_client import MTAGTFSRealtimeClient
-    from src.gtfs_realtime import mta_railroad_pb2
-    GTFS_AVAILABLE = True
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
 except ImportError:
-    GTFS_AVAILABLE = False
-    print("Warning: GTFS client not available. Using mock data.")
+    COMPRESS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
 
 app = Flask(__name__)
 
-# Initialize MTA client if available
-if GTFS_AVAILABLE:
-    mta_client = MTAGTFSRealtimeClient()
+# Compress responses for clients sending Accept-Encoding: gzip
+if COMPRESS_AVAILABLE:
+    Compress(app)
+
+
+def encode_json(obj):
+    """
+    Serialize an object to JSON bytes
+    
+    Uses orjson when installed, which writes bytes directly and is much
+    faster than the stdlib encoder used by jsonify.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def make_etag(body):
+    """
+    Compute the ETag of a response body
+    
+    blake2s is used rather than md5, which FIPS-mode OpenSSL builds refuse.
+    
+    Args:
+        body: Response body bytes
+    
+    Returns:
+        str: 16-character hex digest
+    """
+    return hashlib.blake2s(body, digest_size=8).hexdigest()
+
+
+def json_response(obj, status=200):
+    """
+    Serialize an object to a JSON response
+    
+    Args:
+        obj: JSON-serializable object
+        status: HTTP status code
+    
+    Returns:
+        Response: Flask response with an application/json body
+    """
+    return Response(encode_json(obj), status=status, mimetype="application/json")
+
+
+def cacheable_response(body, etag, mimetype, max_age=60):
+    """
+    Serve a response body that clients and proxies may cache
+    
+    Clients may reuse the body for max_age seconds and then revalidate with
+    the ETag, receiving 304 Not Modified when they already have it.
+    
+    Args:
+        body: Response bytes
+        etag: ETag identifying the body
+        mimetype: Response MIME type
+        max_age: Seconds the response may be cached
+    
+    Returns:
+        Response: Flask response, or 304 if the client's copy is current
+    """
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+# Map route ID fragments to readable line names
+# Note: This is a simple mapping - adjust based on actual GTFS route IDs
+ROUTE_NAMES = {
+    "Hudson": "Hudson Line",
+    "Harlem": "Harlem Line",
+    "NewHaven": "New Haven Line",
+    "NH": "New Haven Line"
+}
+ROUTE_PATTERN = re.compile("|".join(ROUTE_NAMES))
+
+# Seconds a fetched feed is reused before fetching a new one from MTA
+FEED_CACHE_TTL = 15.0
+
+# Largest limit accepted by /api/trains; larger values are clamped so the
+# per-limit response cache holds at most MAX_TRAINS_LIMIT + 2 entries
+MAX_TRAINS_LIMIT = 100
+
+# Last fetched trip updates and the responses built from them, keyed by
+# limit. Each entry is [parsed result, encoded body, ETag]; the body and
+# ETag are filled in the first time the response is served
+_feed_cache = {"ts": 0.0, "trip_updates": None, "responses": {}}
+_feed_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def get_mta_client():
+    """
+    Get the shared MTA GTFS-RT client, importing it on first use
+    
+    Returns:
+        MTAGTFSRealtimeClient: Client for the MTA real-time feed
+    """
+    from src.mta_gtfs_client import MTAGTFSRealtimeClient
+    return MTAGTFSRealtimeClient()
+
+
+@functools.lru_cache(maxsize=1)
+def get_mta_stop_time_extension():
+    """
+    Get the MTA Railroad stop time update extension, importing it on first use
+    
+    Returns:
+        FieldDescriptor: The mta_railroad_stop_time_update extension
+    """
+    from src.gtfs_realtime import mta_railroad_pb2
+    return mta_railroad_pb2.mta_railroad_stop_time_update
+
+
+@functools.lru_cache(maxsize=64)
+def get_route_name(route_id):
+    """
+    Map a GTFS route ID to a readable line name
+    
+    Route IDs come from a small fixed set, so results are cached.
+    
+    Args:
+        route_id: GTFS route ID
+    
+    Returns:
+        str: Readable line name, or the route ID if it is not recognized
+    """
+    match = ROUTE_PATTERN.search(route_id)
+    return ROUTE_NAMES[match.group(0)] if match else route_id
 
 
 def parse_gtfs_to_json(trip_updates, max_trains=10):
@@ -47,158 +203,308 @@ def parse_gtfs_to_json(trip_updates, max_trains=10):
     
     Args:
         trip_updates: List of TripUpdate protobuf messages
-        max_trains: Maximum number of trains to return
+        max_trains: Maximum number of trains to return (None for all)
     
     Returns:
         dict: JSON-serializable dictionary with train data
     """
     trains = []
     
+    # Resolve the extension descriptor once rather than twice per stop
+    mta_stop_ext = get_mta_stop_time_extension()
+    
     for trip_update in trip_updates[:max_trains]:
-        # Extract trip information
-        trip_id = trip_update.trip.trip_id if trip_update.HasField('trip') else "Unknown"
-        route_id = trip_update.trip.route_id if trip_update.HasField('trip') else "Unknown"
+        # Skip trips without stop updates before extracting anything else
+        stops = trip_update.stop_time_update
+        if not stops:
+            continue
+        
+        # Extract trip information (unset fields read as empty strings)
+        trip = trip_update.trip
+        trip_id = trip.trip_id or "Unknown"
+        route_id = trip.route_id or "Unknown"
         
         # Get the next stop information
-        if len(trip_update.stop_time_update) > 0:
-            next_stop = trip_update.stop_time_update[0]
-            
-            # Extract arrival time
-            arrival_time = "N/A"
-            delay_seconds = 0
-            
-            if next_stop.HasField('arrival'):
-                if next_stop.arrival.HasField('time'):
-                    timestamp = next_stop.arrival.time
-                    arrival_dt = datetime.fromtimestamp(timestamp)
-                    arrival_time = arrival_dt.strftime("%H:%M:%S")
-                
-                if next_stop.arrival.HasField('delay'):
-                    delay_seconds = next_stop.arrival.delay
-            
-            # Extract track and status from MTA Railroad extension
-            track = "TBD"
-            train_status = "Unknown"
-            
-            if next_stop.HasExtension(mta_railroad_pb2.mta_railroad_stop_time_update):
-                mta_ext = next_stop.Extensions[mta_railroad_pb2.mta_railroad_stop_time_update]
-                
-                if mta_ext.HasField('track'):
-                    track = mta_ext.track
-                
-                if mta_ext.HasField('trainStatus'):
-                    train_status = mta_ext.trainStatus
-            
-            # Determine status based on delay
-            if delay_seconds > 300:
-                status = "Delayed"
-            elif delay_seconds > 0:
-                status = "Running Late"
-            else:
-                status = train_status if train_status != "Unknown" else "On Time"
-            
-            # Map route ID to readable name
-            # Note: This is a simple mapping - adjust based on actual GTFS route IDs
-            route_name = route_id
-            route_mapping = {
-                "Hudson": "Hudson Line",
-                "Harlem": "Harlem Line", 
-                "NewHaven": "New Haven Line",
-                "NH": "New Haven Line"
-            }
+        next_stop = stops[0]
+        
+        # Extract arrival time
+        arrival_time = "N/A"
+        delay_seconds = 0
+        
+        if next_stop.HasField('arrival'):
+            arrival = next_stop.arrival
+            if arrival.HasField('time'):
+                lt = time.localtime(arrival.time)
+                arrival_time = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
             
-            for key, value in route_mapping.items():
-                if key in route_id:
-                    route_name = value
-                    break
+            if arrival.HasField('delay'):
+                delay_seconds = arrival.delay
+        
+        # Extract track and status from MTA Railroad extension
+        track = "TBD"
+        train_status = "Unknown"
+        
+        if next_stop.HasExtension(mta_stop_ext):
+            mta_ext = next_stop.Extensions[mta_stop_ext]
             
-            # Create train entry
-            train = {
-                "trip_id": trip_id,
-                "route": route_name,
-                "destination": "Grand Central Terminal",  # Could extract from GTFS
-                "track": track,
-                "arrival_time": arrival_time,
-                "status": status,
-                "delay_seconds": delay_seconds
-            }
+            if mta_ext.HasField('track'):
+                track = mta_ext.track
             
-            trains.append(train)
+            if mta_ext.HasField('trainStatus'):
+                train_status = mta_ext.trainStatus
+        
+        # Determine status based on delay
+        if delay_seconds > 300:
+            status = "Delayed"
+        elif delay_seconds > 0:
+            status = "Running Late"
+        else:
+            status = train_status if train_status != "Unknown" else "On Time"
+        
+        # Map route ID to readable name
+        route_name = get_route_name(route_id)
+        
+        # Create train entry
+        train = {
+            "trip_id": trip_id,
+            "route": route_name,
+            "destination": "Grand Central Terminal",  # Could extract from GTFS
+            "track": track,
+            "arrival_time": arrival_time,
+            "status": status,
+            "delay_seconds": delay_seconds
+        }
+        
+        trains.append(train)
     
     return {"trains": trains}
 
 
+def _get_cached_entry(limit):
+    """
+    Get the response cache entry for a limit, fetching the feed at most once per TTL
+    
+    Must be called with _feed_cache_lock held.
+    
+    Args:
+        limit: Maximum number of trains, or None for all trains
+    
+    Returns:
+        list: [parsed result, encoded body or None, ETag or None]
+    """
+    now = time.monotonic()
+    if (_feed_cache["trip_updates"] is None
+            or now - _feed_cache["ts"] > FEED_CACHE_TTL):
+        mta_client = get_mta_client()
+        feed = mta_client.fetch_feed()
+        _feed_cache["trip_updates"] = mta_client.get_trip_updates(feed)
+        _feed_cache["ts"] = now
+        _feed_cache["responses"] = {}
+    
+    entry = _feed_cache["responses"].get(limit)
+    if entry is None:
+        # Transform to JSON format
+        result = parse_gtfs_to_json(_feed_cache["trip_updates"], max_trains=limit)
+        
+        # Add metadata
+        result['updated_at'] = datetime.now().isoformat()
+        result['source'] = 'MTA GTFS-RT'
+        entry = [result, None, None]
+        _feed_cache["responses"][limit] = entry
+    
+    return entry
+
+
+def get_cached_trains(limit):
+    """
+    Get the train response for a limit, fetching the feed at most once per TTL
+    
+    Concurrent requests within the same TTL window share one upstream fetch
+    and one parsed response per limit.
+    
+    Args:
+        limit: Maximum number of trains, or None for all trains
+    
+    Returns:
+        dict: JSON-serializable dictionary with train data and metadata
+    """
+    with _feed_cache_lock:
+        return _get_cached_entry(limit)[0]
+
+
+def get_cached_trains_body(limit):
+    """
+    Get the encoded train response for a limit and its ETag
+    
+    The body is serialized and hashed once per limit and feed fetch, so
+    requests within the same TTL window reuse both.
+    
+    Args:
+        limit: Maximum number of trains, or None for all trains
+    
+    Returns:
+        tuple: (JSON body bytes, ETag)
+    """
+    with _feed_cache_lock:
+        entry = _get_cached_entry(limit)
+        if entry[1] is None:
+            entry[1] = encode_json(entry[0])
+            entry[2] = make_etag(entry[1])
+        return entry[1], entry[2]
+
+
+def mock_trains_response():
+    """
+    Build the mock train response used when the GTFS client is not available
+    
+    Returns:
+        dict: JSON-serializable dictionary with a single mock train
+    """
+    return {
+        "trains": [
+            {
+                "trip_id": "MOCK001",
+                "route": "Hudson Line",
+                "destination": "Grand Central Terminal",
+                "track": "5",
+                "arrival_time": datetime.now().strftime("%H:%M:%S"),
+                "status": "On Time",
+                "delay_seconds": 0
+            }
+        ],
+        "note": "Mock data - GTFS client not configured"
+    }
+
+
 @app.route('/api/trains')
 def get_trains():
     """
     Get upcoming trains in Arduino-compatible JSON format
     
     Query parameters:
-        - limit: Maximum number of trains (default: 10)
+        - limit: Maximum number of trains (default: 10), clamped to
+          0-MAX_TRAINS_LIMIT. Only the first `limit` trip updates of the
+          feed are parsed, so fewer trains are returned when some of them
+          have no stop times.
     
     Returns:
         JSON response with train data
     """
     limit = request.args.get('limit', default=10, type=int)
+    limit = max(0, min(limit, MAX_TRAINS_LIMIT))
     
     if not GTFS_AVAILABLE:
         # Return mock data if GTFS client not available
-        return jsonify({
-            "trains": [
-                {
-                    "trip_id": "MOCK001",
-                    "route": "Hudson Line",
-                    "destination": "Grand Central Terminal",
-                    "track": "5",
-                    "arrival_time": datetime.now().strftime("%H:%M:%S"),
-                    "status": "On Time",
-                    "delay_seconds": 0
-                }
-            ],
-            "note": "Mock data - GTFS client not configured"
-        })
+        return json_response(mock_trains_response())
     
     try:
-        # Fetch real-time data from MTA
-        feed = mta_client.fetch_feed()
-        trip_updates = mta_client.get_trip_updates(feed)
-        
-        # Transform to JSON format
-        result = parse_gtfs_to_json(trip_updates, max_trains=limit)
+        # Fetch real-time data from MTA; the encoded body and its ETag are
+        # shared across requests for a short TTL
+        body, etag = get_cached_trains_body(limit)
         
-        # Add metadata
-        result['updated_at'] = datetime.now().isoformat()
-        result['source'] = 'MTA GTFS-RT'
-        
-        return jsonify(result)
+        # Let clients polling within the feed TTL revalidate instead of refetching
+        return cacheable_response(body, etag, "application/json", max_age=10)
     
     except Exception as e:
-        return jsonify({
+        return json_response({
             "error": str(e),
             "trains": []
-        }), 500
+        }, 500)
 
 
-@app.route('/api/status')
-def status():
-    """Server status endpoint"""
-    return jsonify({
-        "status": "running",
-        "gtfs_available": GTFS_AVAILABLE,
-        "endpoints": {
-            "/api/trains": "Get upcoming trains (JSON)",
-            "/api/trains?limit=5": "Get specific number of trains",
-            "/api/status": "Server status"
-        }
-    })
+@app.route('/api/trains/batch', methods=['POST'])
+def get_trains_batch():
+    """
+    Answer several train queries with a single feed fetch
+    
+    Request body:
+        {"queries": [{"limit": 5, "line": "Hudson"}, {"limit": 3}, ...]}
+        
+        Each query accepts:
+        - limit: Maximum number of trains, a non-negative integer
+          (default: 10). Unlike /api/trains, every trip update is parsed
+          and the limit is applied after the line filter, so a query gets
+          `limit` trains whenever that many match.
+        - line: Only include trains whose route name contains this text
+    
+    Returns:
+        JSON response with one train response per query, in request order,
+        or 400 naming the first invalid query
+    """
+    body = request.get_json(silent=True) or {}
+    queries = body.get('queries')
+    
+    if not isinstance(queries, list):
+        return json_response({
+            "error": "Request body must contain a 'queries' list",
+            "responses": []
+        }, 400)
+    
+    # Validate every query before fetching the feed
+    parsed_queries = []
+    for index, query in enumerate(queries):
+        if not isinstance(query, dict):
+            return json_response({
+                "error": f"Query {index}: must be an object",
+                "responses": []
+            }, 400)
+        
+        limit = query.get('limit', 10)
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+            return json_response({
+                "error": f"Query {index}: 'limit' must be a non-negative integer",
+                "responses": []
+            }, 400)
+        
+        line = query.get('line')
+        if line is not None and not isinstance(line, str):
+            return json_response({
+                "error": f"Query {index}: 'line' must be a string",
+                "responses": []
+            }, 400)
+        
+        parsed_queries.append((limit, line))
+    
+    try:
+        if GTFS_AVAILABLE:
+            all_trains = get_cached_trains(None)
+        else:
+            all_trains = mock_trains_response()
+        
+        responses = []
+        for limit, line in parsed_queries:
+            trains = all_trains["trains"]
+            if line:
+                trains = [train for train in trains if line in train["route"]]
+            
+            response = {key: value for key, value in all_trains.items() if key != "trains"}
+            response["trains"] = trains[:limit]
+            responses.append(response)
+        
+        return json_response({"responses": responses})
+    
+    except Exception as e:
+        return json_response({
+            "error": str(e),
+            "responses": []
+        }, 500)
 
 
-@app.route('/')
-def index():
-    """Welcome page"""
-    gtfs_status = "Connected" if GTFS_AVAILABLE else "Not Available (using mock data)"
-    
-    return f"""
+# Pre-rendered responses for pages that do not change while the server runs
+STATUS_BODY = encode_json({
+    "status": "running",
+    "gtfs_available": GTFS_AVAILABLE,
+    "endpoints": {
+        "/api/trains": "Get upcoming trains (JSON)",
+        "/api/trains?limit=5": "Get specific number of trains",
+        "/api/trains/batch": "Answer several train queries at once (POST)",
+        "/api/status": "Server status"
+    }
+})
+STATUS_ETAG = make_etag(STATUS_BODY)
+
+INDEX_GTFS_STATUS = "Connected" if GTFS_AVAILABLE else "Not Available (using mock data)"
+INDEX_HTML = f"""
     <html>
     <head><title>MNR Train Clock API</title></head>
     <body>
@@ -207,7 +513,7 @@ def index():
         
         <h2>Status</h2>
         <ul>
-            <li>GTFS-RT Client: {gtfs_status}</li>
+            <li>GTFS-RT Client: {INDEX_GTFS_STATUS}</li>
             <li>Server: Running</li>
         </ul>
         
@@ -224,7 +530,20 @@ def index():
         </pre>
     </body>
     </html>
-    """
+    """.encode('utf-8')
+INDEX_ETAG = make_etag(INDEX_HTML)
+
+
+@app.route('/api/status')
+def status():
+    """Server status endpoint"""
+    return cacheable_response(STATUS_BODY, STATUS_ETAG, "application/json")
+
+
+@app.route('/')
+def index():
+    """Welcome page"""
+    return cacheable_response(INDEX_HTML, INDEX_ETAG, "text/html")
 
 
 if __name__ == '__main__':
@@ -246,4 +565,14 @@ if __name__ == '__main__':
     print("\nPress Ctrl+C to stop")
     print("=" * 60 + "\n")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    if os.environ.get("DEV"):
+        # Flask development server with reloader and debugger
+        app.run(host='0.0.0.0', port=5000, debug=True)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("waitress not installed; using Flask's threaded server")
+            app.run(host='0.0.0.0', port=5000, threaded=True)
+        else:
+            serve(app, host='0.0.0.0', port=5000, threads=8, connection_limit=500)
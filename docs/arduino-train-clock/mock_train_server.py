@@ -7,18 +7,30 @@ for testing the Arduino train clock example.
 
 Usage:
     python mock_train_server.py
+    DEV=1 python mock_train_server.py  # Flask debug server
 
 Then configure your Arduino to point to:
     http://<your-ip>:5000/api/trains
 
 Requirements:
     pip install flask
+    pip install orjson  # optional, faster JSON responses
+    pip install waitress  # optional, production WSGI server
 """
 
-from flask import Flask, jsonify
-from datetime import datetime, timedelta
+from flask import Flask, Response, request
+from datetime import datetime
+import hashlib
+import os
 import random
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
 app = Flask(__name__)
 
 # Mock train routes
@@ -33,37 +45,69 @@ DESTINATIONS = [
 STATUSES = ["On Time", "Delayed", "Boarding", "Departed"]
 
 
+def encode_json(obj):
+    """Encode obj as JSON bytes, using orjson if installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def make_etag(body):
+    """Return the ETag of a response body (blake2s, which FIPS builds allow unlike md5)"""
+    return hashlib.blake2s(body, digest_size=8).hexdigest()
+
+
+def json_response(obj, status=200):
+    """Return obj as a JSON response"""
+    return Response(encode_json(obj), status=status, mimetype="application/json")
+
+
+def static_response(body, etag, mimetype):
+    """Return a pre-rendered body with caching headers (304 on ETag match)"""
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response.make_conditional(request)
+
+
 def generate_mock_trains(count=5):
     """Generate mock train data"""
     trains = []
     now = datetime.now()
+    now_seconds = now.hour * 3600 + now.minute * 60 + now.second
+    
+    # Draw the per-train choices in batches rather than one call at a time
+    routes = random.choices(ROUTES, k=count)
+    destinations = random.choices(DESTINATIONS, k=count)
+    rolls = [random.random() for _ in range(2 * count)]
     
     for i in range(count):
         # Generate random delay
-        is_delayed = random.random() < 0.3  # 30% chance of delay
+        is_delayed = rolls[i] < 0.3  # 30% chance of delay
         delay_seconds = random.randint(60, 600) if is_delayed else 0
         
-        # Generate arrival time
+        # Generate arrival time as seconds since midnight (wrapping at 24h)
         minutes_from_now = 5 + (i * 7)
-        arrival_time = now + timedelta(minutes=minutes_from_now, seconds=delay_seconds)
+        arrival_seconds = (now_seconds + minutes_from_now * 60 + delay_seconds) % 86400
+        hours, remainder = divmod(arrival_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
         
         # Determine status
-        if delay_seconds > 300:
-            status = "Delayed"
-        elif delay_seconds > 0:
+        if delay_seconds > 0:
             status = "Delayed"
         else:
             status = random.choice(["On Time", "Boarding"])
         
         # Generate track number
-        track = str(random.randint(1, 12)) if random.random() < 0.9 else "TBD"
+        track = str(random.randint(1, 12)) if rolls[count + i] < 0.9 else "TBD"
         
         train = {
             "trip_id": f"MNR{1000000 + i}",
-            "route": random.choice(ROUTES),
-            "destination": random.choice(DESTINATIONS),
+            "route": routes[i],
+            "destination": destinations[i],
             "track": track,
-            "arrival_time": arrival_time.strftime("%H:%M:%S"),
+            "arrival_time": f"{hours:02d}:{minutes:02d}:{seconds:02d}",
             "status": status,
             "delay_seconds": delay_seconds
         }
@@ -76,38 +120,33 @@ def generate_mock_trains(count=5):
 def get_trains():
     """Return mock train data as JSON"""
     trains = generate_mock_trains(count=5)
-    return jsonify({"trains": trains})
+    return json_response({"trains": trains})
 
 
 @app.route('/api/trains/<int:count>')
 def get_trains_count(count):
     """Return specified number of mock trains"""
     if count < 1 or count > 20:
-        return jsonify({"error": "Count must be between 1 and 20"}), 400
+        return json_response({"error": "Count must be between 1 and 20"}, 400)
     
     trains = generate_mock_trains(count=count)
-    return jsonify({"trains": trains})
-
-
-@app.route('/api/status')
-def status():
-    """Server status endpoint"""
-    return jsonify({
-        "status": "running",
-        "server": "Mock MNR Train Data Server",
-        "version": "1.0",
-        "endpoints": {
-            "/api/trains": "Get 5 upcoming trains",
-            "/api/trains/<count>": "Get specified number of trains",
-            "/api/status": "Server status"
-        }
-    })
-
+    return json_response({"trains": trains})
+
+
+# Pre-rendered responses for pages that never change
+STATUS_BODY = encode_json({
+    "status": "running",
+    "server": "Mock MNR Train Data Server",
+    "version": "1.0",
+    "endpoints": {
+        "/api/trains": "Get 5 upcoming trains",
+        "/api/trains/<count>": "Get specified number of trains",
+        "/api/status": "Server status"
+    }
+})
+STATUS_ETAG = make_etag(STATUS_BODY)
 
-@app.route('/')
-def index():
-    """Welcome page"""
-    return """
+INDEX_HTML = b"""
     <html>
     <head><title>Mock MNR Train Server</title></head>
     <body>
@@ -146,6 +185,19 @@ def index():
     </body>
     </html>
     """
+INDEX_ETAG = make_etag(INDEX_HTML)
+
+
+@app.route('/api/status')
+def status():
+    """Server status endpoint"""
+    return static_response(STATUS_BODY, STATUS_ETAG, "application/json")
+
+
+@app.route('/')
+def index():
+    """Welcome page"""
+    return static_response(INDEX_HTML, INDEX_ETAG, "text/html")
 
 
 if __name__ == '__main__':
@@ -159,4 +211,14 @@ if __name__ == '__main__':
     print("\nPress Ctrl+C to stop the server")
     print("=" * 60)
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    if os.environ.get("DEV"):
+        # Flask development server with reloader and debugger
+        app.run(host='0.0.0.0', port=5000, debug=True)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("waitress not installed; using Flask's threaded server")
+            app.run(host='0.0.0.0', port=5000, threaded=True)
+        else:
+            serve(app, host='0.0.0.0', port=5000, threads=8, connection_limit=500)
@@ -14,6 +14,39 @@ import sys
 from src.mta_gtfs_client import MTAGTFSRealtimeClient
 
 
+def format_alert(index, alert):
+    """
+    Format a service alert for display.
+    
+    Args:
+        index: Zero-based position of the alert in the displayed list
+        alert: Alert entity to display
+        
+    Returns:
+        str: Multi-line description of the alert
+    """
+    lines = [f"\n=== Alert {index + 1} ==="]
+    
+    # Display header text
+    if alert.header_text.translation:
+        lines.append(f"Header: {alert.header_text.translation[0].text}")
+    
+    # Display description
+    if alert.description_text.translation:
+        lines.append(f"Description: {alert.description_text.translation[0].text}")
+    
+    # Display affected entities
+    if alert.informed_entity:
+        lines.append(f"Affected Entities:")
+        for entity in alert.informed_entity:
+            if entity.HasField('route_id'):
+                lines.append(f"  - Route: {entity.route_id}")
+            if entity.HasField('trip'):
+                lines.append(f"  - Trip: {entity.trip.trip_id}")
+    
+    return "\n".join(lines)
+
+
 def main():
     """Main entry point for the MTA GTFS-RT demo program."""
     
@@ -82,8 +115,12 @@ def main():
             print(f"TRIP UPDATES (showing up to {args.max_trips})")
             print("=" * 80)
             
-            for i, trip_update in enumerate(trip_updates[:args.max_trips]):
-                client.print_trip_update_details(trip_update)
+            # Format the whole section and write it in one call
+            sections = [
+                client.format_trip_update_details(trip_update)
+                for trip_update in trip_updates[:args.max_trips]
+            ]
+            sys.stdout.write("\n".join(sections) + "\n")
         
         # Display vehicle positions
         if vehicle_positions:
@@ -91,8 +128,11 @@ def main():
             print(f"VEHICLE POSITIONS (showing up to {args.max_vehicles})")
             print("=" * 80)
             
-            for i, vehicle_pos in enumerate(vehicle_positions[:args.max_vehicles]):
-                client.print_vehicle_position_details(vehicle_pos)
+            sections = [
+                client.format_vehicle_position_details(vehicle_pos)
+                for vehicle_pos in vehicle_positions[:args.max_vehicles]
+            ]
+            sys.stdout.write("\n".join(sections) + "\n")
         
         # Display service alerts
         if alerts:
@@ -100,25 +140,11 @@ def main():
             print(f"SERVICE ALERTS (showing up to {args.max_alerts})")
             print("=" * 80)
             
-            for i, alert in enumerate(alerts[:args.max_alerts]):
-                print(f"\n=== Alert {i + 1} ===")
-                
-                # Display header text
-                if alert.header_text.translation:
-                    print(f"Header: {alert.header_text.translation[0].text}")
-                
-                # Display description
-                if alert.description_text.translation:
-                    print(f"Description: {alert.description_text.translation[0].text}")
-                
-                # Display affected entities
-                if alert.informed_entity:
-                    print(f"Affected Entities:")
-                    for entity in alert.informed_entity:
-                        if entity.HasField('route_id'):
-                            print(f"  - Route: {entity.route_id}")
-                        if entity.HasField('trip'):
-                            print(f"  - Trip: {entity.trip.trip_id}")
+            sections = [
+                format_alert(i, alert)
+                for i, alert in enumerate(alerts[:args.max_alerts])
+            ]
+            sys.stdout.write("\n".join(sections) + "\n")
         
         print("\n" + "=" * 80)
         print("Feed fetch completed successfully!")
@@ -6,18 +6,96 @@ from the MTA Metro-North Railroad feed. The downloader enforces rate limiting
 to prevent excessive downloads.
 """
 
+import os
+import errno
+import json
 import zipfile
 import shutil
 import time
 import logging
 from pathlib import Path
 from datetime import datetime
+from contextlib import contextmanager
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Optional, Set
+from urllib3.util.retry import Retry
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _file_lock(lock_path: Path):
+    """
+    Hold an exclusive OS-level lock on a file for the duration of a block.
+    
+    The lock is shared between threads and processes, since each holder
+    opens the lock file separately. Waiting is unbounded on every platform:
+    on Windows, where msvcrt.locking gives up after about ten seconds, the
+    lock attempt is repeated until it succeeds.
+    
+    Args:
+        lock_path: Path of the lock file (created if missing)
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a+b') as lock_file:
+        fd = lock_file.fileno()
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as e:
+                    # LK_LOCK retries for ~10 s, then fails with EDEADLOCK
+                    if e.errno != errno.EDEADLOCK:
+                        raise
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session with a keep-alive connection pool and retries.
+    
+    Reusing one session lets repeated downloads reuse the TCP/TLS connection
+    instead of performing a new handshake per request.
+    
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session used by downloaders that are not given one explicitly
+_SESSION = create_session()
+
+# Sentinel for optional arguments where None is a meaningful value
+_UNSET = object()
+
+
 class GTFSDownloader:
     """
     Downloads and updates GTFS static schedule data.
@@ -35,12 +113,28 @@ class GTFSDownloader:
     # Minimum time between downloads (in seconds) - 1 day by default
     DEFAULT_MIN_DOWNLOAD_INTERVAL = 24 * 60 * 60  # 24 hours
     
+    # Chunk size used when streaming the ZIP file to disk
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024  # 64 KB
+    
+    # GTFS files needed for schedule lookups (excludes large files like shapes.txt)
+    CORE_GTFS_FILES = frozenset({
+        "agency.txt",
+        "routes.txt",
+        "stops.txt",
+        "trips.txt",
+        "stop_times.txt",
+        "calendar.txt",
+        "calendar_dates.txt",
+    })
+    
     def __init__(
         self,
         gtfs_url: str = DEFAULT_GTFS_URL,
         output_dir: Optional[Path] = None,
         min_download_interval: int = DEFAULT_MIN_DOWNLOAD_INTERVAL,
-        timestamp_file: Optional[Path] = None
+        timestamp_file: Optional[Path] = None,
+        extract_members: Optional[Set[str]] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the GTFS downloader.
@@ -50,9 +144,15 @@ class GTFSDownloader:
             output_dir: Directory to extract GTFS files to
             min_download_interval: Minimum seconds between downloads
             timestamp_file: File to store last download timestamp
+            extract_members: Names of archive members to extract, or None to
+                extract all files (e.g. CORE_GTFS_FILES)
+            session: HTTP session to download with (defaults to a shared
+                pooled session)
         """
         self.gtfs_url = gtfs_url
         self.min_download_interval = min_download_interval
+        self.extract_members = set(extract_members) if extract_members is not None else None
+        self.session = session if session is not None else _SESSION
         
         # Set default output directory if not provided
         if output_dir is None:
@@ -60,44 +160,117 @@ class GTFSDownloader:
         else:
             self.output_dir = Path(output_dir).resolve()
         
-        # Set timestamp file path
+        # Set metadata file path (last download timestamp and cache validators)
         if timestamp_file is None:
             self.timestamp_file = self.output_dir.parent / ".last_download"
         else:
             self.timestamp_file = Path(timestamp_file)
+        
+        # Lock file serializing downloads across threads and processes
+        self.lock_file = self.output_dir.parent / ".gtfs.lock"
     
-    def _get_last_download_time(self) -> Optional[float]:
+    def _read_metadata(self) -> dict:
         """
-        Get the timestamp of the last download.
+        Read the download metadata file.
+        
+        The file holds a JSON object with the last download 'timestamp' and
+        the 'etag'/'last_modified' validators. Files written by older versions
+        contain only the bare timestamp.
         
         Returns:
-            Unix timestamp of last download, or None if never downloaded
+            Metadata dictionary (empty if never downloaded or unreadable)
         """
         if not self.timestamp_file.exists():
-            return None
+            return {}
         
         try:
             with open(self.timestamp_file, 'r') as f:
-                return float(f.read().strip())
+                data = json.loads(f.read())
         except (ValueError, IOError) as e:
             logger.warning(f"Could not read timestamp file: {e}")
-            return None
+            return {}
+        
+        if isinstance(data, (int, float)):
+            return {'timestamp': float(data)}
+        if not isinstance(data, dict):
+            logger.warning("Could not read timestamp file: unexpected format")
+            return {}
+        return data
     
-    def _update_last_download_time(self):
-        """Update the last download timestamp to current time."""
+    def _write_metadata(self, metadata: dict):
+        """
+        Atomically write the download metadata file.
+        
+        The data is written to a temporary file and renamed over the old file,
+        so readers never observe a truncated or partially written file.
+        
+        Args:
+            metadata: Metadata dictionary to store
+        """
+        tmp_file = self.timestamp_file.with_suffix(".tmp")
         try:
             self.timestamp_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.timestamp_file, 'w') as f:
-                f.write(str(time.time()))
+            with open(tmp_file, 'w') as f:
+                json.dump(metadata, f)
+            os.replace(tmp_file, self.timestamp_file)
         except IOError as e:
             logger.error(f"Could not write timestamp file: {e}")
     
-    def should_download(self, force: bool = False) -> bool:
+    def _get_last_download_time(self) -> Optional[float]:
+        """
+        Get the timestamp of the last download.
+        
+        Returns:
+            Unix timestamp of last download, or None if never downloaded
+        """
+        timestamp = self._read_metadata().get('timestamp')
+        return float(timestamp) if timestamp is not None else None
+    
+    def _update_last_download_time(self, validators: Optional[dict] = None):
+        """
+        Update the last download timestamp to current time.
+        
+        Args:
+            validators: New 'etag'/'last_modified' cache validators, or None
+                to keep the stored ones
+        """
+        metadata = self._read_metadata()
+        metadata['timestamp'] = time.time()
+        if validators is not None:
+            metadata['etag'] = validators.get('etag')
+            metadata['last_modified'] = validators.get('last_modified')
+        self._write_metadata(metadata)
+    
+    def _get_cache_validators(self) -> dict:
+        """
+        Get the HTTP cache validators saved from the last download.
+        
+        Returns:
+            Dictionary with 'etag' and 'last_modified' keys (values may be None)
+        """
+        # Validators are meaningless if the extracted data is missing
+        if not self.output_dir.exists():
+            return {'etag': None, 'last_modified': None}
+        
+        metadata = self._read_metadata()
+        return {
+            'etag': metadata.get('etag'),
+            'last_modified': metadata.get('last_modified'),
+        }
+    
+    def should_download(
+        self,
+        force: bool = False,
+        *,
+        last_download: Optional[float] = _UNSET
+    ) -> bool:
         """
         Check if a download should be performed based on rate limiting.
         
         Args:
             force: If True, bypass rate limiting check
+            last_download: Last download timestamp if already known, to avoid
+                re-reading the timestamp file
             
         Returns:
             True if download should proceed, False otherwise
@@ -105,22 +278,32 @@ class GTFSDownloader:
         if force:
             return True
         
-        last_download = self._get_last_download_time()
+        if last_download is _UNSET:
+            last_download = self._get_last_download_time()
         if last_download is None:
             return True
         
         time_since_last = time.time() - last_download
         return time_since_last >= self.min_download_interval
     
-    def get_time_until_next_download(self) -> Optional[float]:
+    def get_time_until_next_download(
+        self,
+        *,
+        last_download: Optional[float] = _UNSET
+    ) -> Optional[float]:
         """
         Get seconds until next download is allowed.
         
+        Args:
+            last_download: Last download timestamp if already known, to avoid
+                re-reading the timestamp file
+        
         Returns:
             Seconds until next download, 0 if download is allowed now,
             or None if never downloaded before
         """
-        last_download = self._get_last_download_time()
+        if last_download is _UNSET:
+            last_download = self._get_last_download_time()
         if last_download is None:
             return None
         
@@ -135,79 +318,128 @@ class GTFSDownloader:
         Args:
             force: If True, bypass rate limiting
             
+        Only one download runs at a time; a caller that had to wait for
+        another download to finish returns without downloading again.
+        
         Returns:
-            True if download succeeded, False otherwise
+            True if download succeeded (or another caller just completed one),
+            False otherwise
             
         Raises:
             ValueError: If download is not allowed due to rate limiting
         """
         # Check rate limiting
-        if not self.should_download(force):
-            time_remaining = self.get_time_until_next_download()
+        last_download = self._get_last_download_time()
+        if not self.should_download(force, last_download=last_download):
+            time_remaining = self.get_time_until_next_download(last_download=last_download)
             hours_remaining = time_remaining / 3600
             raise ValueError(
                 f"Download rate limit exceeded. "
                 f"Next download allowed in {hours_remaining:.1f} hours"
             )
         
+        with _file_lock(self.lock_file):
+            # Another thread or process may have downloaded while we waited
+            if self._get_last_download_time() != last_download:
+                logger.info("GTFS data was updated by another download")
+                return True
+            
+            return self._download_and_extract_locked()
+    
+    def _download_and_extract_locked(self) -> bool:
+        """
+        Download and extract GTFS data while holding the download lock.
+        
+        Returns:
+            True if download succeeded, False otherwise
+        """
         logger.info(f"Downloading GTFS data from {self.gtfs_url}")
         
-        # Create temporary directory for download
-        temp_dir = self.output_dir.parent / ".gtfs_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_zip = temp_dir / "gtfs.zip"
+        # Download to a partial file and extract into a staging directory
+        # next to the output directory, so the live data is swapped in one step
+        temp_zip = self.output_dir.parent / ".gtfs.zip.part"
+        staging_dir = self.output_dir.parent / ".gtfs_new"
+        self.output_dir.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Send conditional request headers so an unchanged feed returns 304
+        headers = {}
+        validators = self._get_cache_validators()
+        if validators['etag']:
+            headers['If-None-Match'] = validators['etag']
+        if validators['last_modified']:
+            headers['If-Modified-Since'] = validators['last_modified']
         
         try:
-            # Download the ZIP file
-            response = requests.get(self.gtfs_url, timeout=60)
-            response.raise_for_status()
+            # Stream the ZIP file to disk so only one chunk is held in memory
+            with self.session.get(
+                self.gtfs_url, timeout=60, stream=True, headers=headers
+            ) as response:
+                if response.status_code == 304:
+                    logger.info("GTFS feed unchanged since last download")
+                    self._update_last_download_time()
+                    return True
+                
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                with open(temp_zip, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=self.DOWNLOAD_CHUNK_SIZE)
+                
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
             
-            with open(temp_zip, 'wb') as f:
-                f.write(response.content)
+            logger.info(f"Downloaded {temp_zip.stat().st_size} bytes")
             
-            logger.info(f"Downloaded {len(response.content)} bytes")
-            
-            # Extract the ZIP file
+            # Extract the ZIP file into the staging directory
             logger.info(f"Extracting to {self.output_dir}")
             
-            # Remove old data if it exists
-            if self.output_dir.exists():
-                shutil.rmtree(self.output_dir)
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
             
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Extract all files
             with zipfile.ZipFile(temp_zip, 'r') as zip_ref:
-                zip_ref.extractall(self.output_dir)
+                if self.extract_members is None:
+                    zip_ref.extractall(staging_dir)
+                else:
+                    members = [
+                        name for name in zip_ref.namelist()
+                        if name in self.extract_members
+                    ]
+                    zip_ref.extractall(staging_dir, members=members)
             
-            logger.info("Extraction complete")
+            # Swap the new data in place of the old data
+            if self.output_dir.exists():
+                shutil.rmtree(self.output_dir)
+            os.replace(staging_dir, self.output_dir)
             
-            # Update timestamp
-            self._update_last_download_time()
+            logger.info("Extraction complete")
             
-            # Cleanup temp directory
-            shutil.rmtree(temp_dir)
+            # Update timestamp and cache validators
+            self._update_last_download_time(
+                {'etag': etag, 'last_modified': last_modified}
+            )
             
             return True
             
         except requests.RequestException as e:
             logger.error(f"Failed to download GTFS data: {e}")
             # Cleanup on error
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
             return False
         except zipfile.BadZipFile as e:
             logger.error(f"Downloaded file is not a valid ZIP: {e}")
             # Cleanup on error
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
             return False
         except Exception as e:
             logger.error(f"Unexpected error during download: {e}")
             # Cleanup on error
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
             return False
+        finally:
+            temp_zip.unlink(missing_ok=True)
     
     def get_download_info(self) -> dict:
         """
@@ -216,9 +448,10 @@ class GTFSDownloader:
         Returns:
             Dictionary with download information
         """
+        # Read the timestamp file once and share it with the helpers
         last_download = self._get_last_download_time()
-        can_download = self.should_download()
-        time_until_next = self.get_time_until_next_download()
+        can_download = self.should_download(last_download=last_download)
+        time_until_next = self.get_time_until_next_download(last_download=last_download)
         
         info = {
             'gtfs_url': self.gtfs_url,
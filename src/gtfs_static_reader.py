@@ -6,12 +6,166 @@ This module provides functionality to read and cache GTFS static schedule data
 """
 
 import csv
+import io
 import logging
+import marshal
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, FrozenSet, Iterator, List, NamedTuple, Set, Tuple, Type
 
 logger = logging.getLogger(__name__)
 
+# GTFS tables the reader keeps, each backed by <table>.txt
+GTFS_TABLES = ('routes', 'stops', 'trips')
+
+
+class RouteRow(NamedTuple):
+    """Stored columns of one routes.txt row"""
+    route_long_name: str
+    route_short_name: str
+    route_color: str
+    route_text_color: str
+    route_type: str
+    route_desc: str
+    route_url: str
+
+
+class StopRow(NamedTuple):
+    """Stored columns of one stops.txt row"""
+    stop_name: str
+    stop_code: str
+    stop_lat: str
+    stop_lon: str
+    wheelchair_boarding: str
+    stop_desc: str
+    stop_url: str
+    zone_id: str
+    location_type: str
+    parent_station: str
+    platform_code: str
+
+
+class TripRow(NamedTuple):
+    """Stored columns of one trips.txt row"""
+    trip_headsign: str
+    trip_short_name: str
+    direction_id: str
+    route_id: str
+    block_id: str
+    shape_id: str
+    wheelchair_accessible: str
+    bikes_allowed: str
+
+
+# Columns kept from each GTFS table, in the order they are stored in a row
+ROUTE_FIELDS = RouteRow._fields
+STOP_FIELDS = StopRow._fields
+TRIP_FIELDS = TripRow._fields
+
+# Columns enrich_train_info() uses; pass as GTFSStaticReader(fields=...) to
+# skip storing the rest
+ENRICHMENT_FIELDS = {
+    'routes': {'route_long_name', 'route_color', 'route_desc', 'route_url'},
+    'stops': {'stop_name', 'stop_lat', 'stop_lon', 'platform_code'},
+    'trips': {'trip_headsign', 'direction_id', 'wheelchair_accessible', 'bikes_allowed', 'route_id'},
+}
+
+# Pulls (stop_name, stop_lat, stop_lon) out of a stop row in one C-level call
+_stop_location = itemgetter(*(STOP_FIELDS.index(f) for f in ('stop_name', 'stop_lat', 'stop_lon')))
+
+# Bump when the cached row layout changes so stale caches are ignored
+CACHE_VERSION = 3
+
+# Columns with few distinct values, pooled so rows share string objects
+STOP_POOLED = frozenset({
+    'wheelchair_boarding', 'zone_id', 'location_type', 'parent_station', 'platform_code',
+})
+TRIP_POOLED = frozenset({
+    'trip_headsign', 'direction_id', 'route_id', 'block_id', 'shape_id',
+    'wheelchair_accessible', 'bikes_allowed',
+})
+
+
+def _check_cached_rows(items, width: int):
+    """
+    Check that loaded cache rows are (str, tuple of width strs) pairs.
+    
+    Raises:
+        ValueError: If any row has another shape or type
+    """
+    if type(items) is not tuple:
+        raise ValueError("cached rows are not a tuple")
+    for item in items:
+        if type(item) is not tuple or len(item) != 2:
+            raise ValueError("cached row is not a (key, values) pair")
+        key, values = item
+        if (type(key) is not str or type(values) is not tuple or len(values) != width
+                or not all(type(value) is str for value in values)):
+            raise ValueError(f"cached row {key!r} has unexpected types")
+
+
+def _read_csv_columns(path: Path, key_field: str, fields: Tuple[str, ...],
+                      pooled: FrozenSet[str] = frozenset(),
+                      keep: Optional[FrozenSet[str]] = None) -> Iterator[Tuple[str, tuple]]:
+    """
+    Read selected columns from a GTFS text file.
+    
+    Column positions are resolved once from the header so each row is
+    picked apart by index instead of being turned into a dict. Columns
+    missing from the file read as empty strings.
+    
+    Args:
+        path: Path to the GTFS text file
+        key_field: Column holding the row identifier
+        fields: Columns to return for each row
+        pooled: Low-cardinality columns whose values are shared through a
+            per-column pool so repeated values reuse one string object
+        keep: Columns to actually read; the others read as empty strings.
+            None reads every column in fields
+        
+    Yields:
+        (key, values) tuples for every row with a non-empty key
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    # One read and one decode for the whole file; utf-8-sig drops the BOM
+    # some feeds prepend, which would otherwise hide the first header name
+    reader = csv.reader(io.StringIO(path.read_bytes().decode('utf-8-sig'), newline=''))
+    header = next(reader, None)
+    if not header or key_field not in header:
+        return
+    
+    key_index = header.index(key_field)
+    width = len(header)
+    
+    # Every row gets one trailing blank cell; columns that are missing or not
+    # kept point at it, so one itemgetter call slices out the whole tuple
+    indices = [
+        header.index(field) if field in header and (keep is None or field in keep) else width
+        for field in fields
+    ]
+    get_values = itemgetter(*indices)
+    pools = [(i, {}) for field, i in zip(fields, indices) if field in pooled and i < width]
+    
+    for row in reader:
+        if len(row) != width:
+            row = (row + [''] * width)[:width]
+        key = row[key_index]
+        if not key:
+            continue
+        row.append('')
+        for i, pool in pools:
+            value = row[i]
+            row[i] = pool.setdefault(value, value)
+        yield key, get_values(row)
+
 
 class GTFSStaticReader:
     """
@@ -21,30 +175,58 @@ class GTFSStaticReader:
     and provides fast lookup methods to enrich real-time data.
     """
     
-    def __init__(self, gtfs_dir: Path):
+    def __init__(self, gtfs_dir: Path, *, fields: Optional[Dict[str, Set[str]]] = None):
         """
         Initialize the GTFS static data reader.
         
         Args:
             gtfs_dir: Path to directory containing GTFS text files
+            fields: Optional per-table whitelist of columns to store, keyed by
+                'routes', 'stops' and 'trips' (see ENRICHMENT_FIELDS). Columns
+                left out read as empty strings. Tables not listed, or None,
+                keep every column
         """
         self.gtfs_dir = Path(gtfs_dir)
-        self._routes: Dict[str, dict] = {}
-        self._stops: Dict[str, dict] = {}
-        self._trips: Dict[str, dict] = {}
+        self.fields = {table: frozenset(columns) for table, columns in (fields or {}).items()}
+        # (source text file, row cache) for each table, resolved once
+        self._table_files = {
+            table: (self.gtfs_dir / f"{table}.txt", self.gtfs_dir / f".{table}.cache.marshal")
+            for table in GTFS_TABLES
+        }
+        # Rows are stored as RouteRow/StopRow/TripRow named tuples
+        self._routes: Dict[str, RouteRow] = {}
+        self._stops: Dict[str, StopRow] = {}
+        self._trips: Dict[str, TripRow] = {}
         self._loaded = False
+        
+        # Tables are parsed on first use; each table's lock keeps concurrent
+        # callers from parsing the same file twice
+        self._tables_loaded = set()
+        self._table_locks = {table: threading.Lock() for table in GTFS_TABLES}
+        
+        # Sorted listings are built on first request and reused until reload()
+        self._all_stops_sorted: Optional[list] = None
+        self._all_routes_sorted: Optional[list] = None
+        self._stop_choices: Optional[List[Tuple[str, str]]] = None
     
-    def load(self) -> bool:
+    def load(self, lazy: bool = False) -> bool:
         """
         Load GTFS static data from text files.
         
+        Args:
+            lazy: If True, defer parsing each table until it is first looked up
+        
         Returns:
             True if data loaded successfully, False otherwise
         """
+        if lazy:
+            self._loaded = True
+            return True
+        
         try:
-            self._load_routes()
-            self._load_stops()
-            self._load_trips()
+            # The tables are independent, so read them concurrently
+            with ThreadPoolExecutor(max_workers=len(GTFS_TABLES)) as executor:
+                list(executor.map(partial(self._ensure_table, raise_errors=True), GTFS_TABLES))
             self._loaded = True
             logger.info(f"Loaded GTFS data: {len(self._routes)} routes, "
                        f"{len(self._stops)} stops, {len(self._trips)} trips")
@@ -54,76 +236,145 @@ class GTFSStaticReader:
             self._loaded = False
             return False
     
-    def _load_routes(self):
-        """Load routes from routes.txt"""
-        routes_file = self.gtfs_dir / "routes.txt"
-        if not routes_file.exists():
-            logger.warning(f"Routes file not found: {routes_file}")
+    def reload(self, lazy: bool = False) -> bool:
+        """
+        Drop all loaded tables and load them again, e.g. after a GTFS update.
+        
+        Args:
+            lazy: If True, defer parsing each table until it is first looked up
+        
+        Returns:
+            True if data loaded successfully, False otherwise
+        """
+        with ExitStack() as stack:
+            for lock in self._table_locks.values():
+                stack.enter_context(lock)
+            self._routes = {}
+            self._stops = {}
+            self._trips = {}
+            self._tables_loaded = set()
+            self._all_stops_sorted = None
+            self._all_routes_sorted = None
+            self._stop_choices = None
+            self._loaded = False
+        return self.load(lazy=lazy)
+    
+    def _ensure_table(self, table: str, raise_errors: bool = False):
+        """
+        Parse a table on first use.
+        
+        Args:
+            table: One of 'routes', 'stops' or 'trips'
+            raise_errors: Propagate parse errors instead of logging them and
+                leaving the table empty
+        """
+        if table in self._tables_loaded:
             return
         
-        with open(routes_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                route_id = row.get('route_id')
-                if route_id:
-                    self._routes[route_id] = {
-                        'route_long_name': row.get('route_long_name', ''),
-                        'route_short_name': row.get('route_short_name', ''),
-                        'route_color': row.get('route_color', ''),
-                        'route_text_color': row.get('route_text_color', ''),
-                        'route_type': row.get('route_type', ''),
-                        'route_desc': row.get('route_desc', ''),  # NEW: Route description
-                        'route_url': row.get('route_url', ''),  # NEW: Route URL
-                    }
+        with self._table_locks[table]:
+            if table in self._tables_loaded:
+                return
+            try:
+                getattr(self, f'_load_{table}')()
+            except Exception as e:
+                getattr(self, f'_{table}').clear()
+                if raise_errors:
+                    raise
+                logger.error(f"Failed to load GTFS {table}: {e}")
+            self._tables_loaded.add(table)
+    
+    def _load_routes(self):
+        """Load routes from routes.txt"""
+        self._routes = self._read_table('routes', 'route_id', RouteRow)
     
     def _load_stops(self):
         """Load stops from stops.txt"""
-        stops_file = self.gtfs_dir / "stops.txt"
-        if not stops_file.exists():
-            logger.warning(f"Stops file not found: {stops_file}")
-            return
-        
-        with open(stops_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                stop_id = row.get('stop_id')
-                if stop_id:
-                    self._stops[stop_id] = {
-                        'stop_name': row.get('stop_name', ''),
-                        'stop_code': row.get('stop_code', ''),
-                        'stop_lat': row.get('stop_lat', ''),
-                        'stop_lon': row.get('stop_lon', ''),
-                        'wheelchair_boarding': row.get('wheelchair_boarding', ''),
-                        'stop_desc': row.get('stop_desc', ''),  # NEW: Stop description
-                        'stop_url': row.get('stop_url', ''),  # NEW: Stop URL
-                        'zone_id': row.get('zone_id', ''),  # NEW: Fare zone
-                        'location_type': row.get('location_type', ''),  # NEW: Location type
-                        'parent_station': row.get('parent_station', ''),  # NEW: Parent station
-                        'platform_code': row.get('platform_code', ''),  # NEW: Platform code
-                    }
+        self._stops = self._read_table('stops', 'stop_id', StopRow, STOP_POOLED)
     
     def _load_trips(self):
         """Load trips from trips.txt"""
-        trips_file = self.gtfs_dir / "trips.txt"
-        if not trips_file.exists():
-            logger.warning(f"Trips file not found: {trips_file}")
-            return
+        self._trips = self._read_table('trips', 'trip_id', TripRow, TRIP_POOLED)
+    
+    def _read_table(self, table: str, key_field: str, row_type: Type[NamedTuple],
+                    pooled: FrozenSet[str] = frozenset()) -> Dict[str, NamedTuple]:
+        """
+        Read a table, reusing the rows from a previous parse when the source
+        file is unchanged.
+        
+        The cache is keyed by the text file's mtime and size, so a fresh GTFS
+        download invalidates it automatically. The cache is written with
+        marshal rather than pickle, and every loaded row is checked to be a
+        (str, tuple of str) pair of the right width before it is used; a cache
+        that fails the check is ignored and the text file parsed instead.
+        marshal is not hardened against maliciously constructed files, so the
+        data directory must not be writable by untrusted users. Cache files
+        are created readable by the owner only.
+        
+        Args:
+            table: Table name, e.g. 'stops' for stops.txt
+            key_field: Column holding the row identifier
+            row_type: NamedTuple class whose fields are the columns to keep
+            pooled: Low-cardinality columns to share string objects for
+            
+        Returns:
+            Dictionary mapping row ID to a row_type instance
+        """
+        source, cache_file = self._table_files[table]
+        try:
+            stat = source.stat()
+        except FileNotFoundError:
+            logger.warning(f"{table.capitalize()} file not found: {source}")
+            return {}
+        
+        fields = row_type._fields
+        keep = self.fields.get(table)
+        fingerprint = (
+            CACHE_VERSION, fields, tuple(sorted(keep)) if keep is not None else None,
+            stat.st_mtime_ns, stat.st_size
+        )
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_fingerprint, items = marshal.load(f)
+            if cached_fingerprint == fingerprint:
+                _check_cached_rows(items, len(fields))
+                make_row = row_type._make
+                rows = {key: make_row(values) for key, values in items}
+                logger.debug(f"Loaded {len(rows)} {table} from {cache_file}")
+                return rows
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable GTFS cache {cache_file}: {e}")
         
-        with open(trips_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                trip_id = row.get('trip_id')
-                if trip_id:
-                    self._trips[trip_id] = {
-                        'trip_headsign': row.get('trip_headsign', ''),
-                        'trip_short_name': row.get('trip_short_name', ''),
-                        'direction_id': row.get('direction_id', ''),
-                        'route_id': row.get('route_id', ''),
-                        'block_id': row.get('block_id', ''),  # NEW: Block identifier
-                        'shape_id': row.get('shape_id', ''),  # NEW: Shape for trip path
-                        'wheelchair_accessible': row.get('wheelchair_accessible', ''),  # NEW: Wheelchair accessibility
-                        'bikes_allowed': row.get('bikes_allowed', ''),  # NEW: Bike allowance
-                    }
+        make_row = row_type._make
+        try:
+            rows = {
+                key: make_row(values)
+                for key, values in _read_csv_columns(source, key_field, fields, pooled, keep)
+            }
+        except FileNotFoundError:
+            # Removed between the stat above and the read, e.g. mid-update
+            logger.warning(f"{table.capitalize()} file not found: {source}")
+            return {}
+        logger.debug(f"Parsed {len(rows)} {table} from {source}")
+        
+        # Each writer gets its own temp file so processes loading the same
+        # directory at once never interleave their bytes before the rename
+        temp_file = None
+        try:
+            fd, temp_file = tempfile.mkstemp(dir=self.gtfs_dir, prefix=cache_file.name, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                # Rows are stored as (key, values) tuples; marshal keeps shared
+                # (pooled) strings shared
+                items = tuple((key, tuple(row)) for key, row in rows.items())
+                marshal.dump((fingerprint, items), f)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write GTFS cache {cache_file}: {e}")
+            if temp_file:
+                Path(temp_file).unlink(missing_ok=True)
+        
+        return rows
     
     def get_route_info(self, route_id: str) -> Optional[dict]:
         """
@@ -135,7 +386,9 @@ class GTFSStaticReader:
         Returns:
             Dictionary with route info, or None if not found
         """
-        return self._routes.get(route_id)
+        self._ensure_table('routes')
+        row = self._routes.get(route_id)
+        return row._asdict() if row is not None else None
     
     def get_stop_info(self, stop_id: str) -> Optional[dict]:
         """
@@ -147,7 +400,9 @@ class GTFSStaticReader:
         Returns:
             Dictionary with stop info, or None if not found
         """
-        return self._stops.get(stop_id)
+        self._ensure_table('stops')
+        row = self._stops.get(stop_id)
+        return row._asdict() if row is not None else None
     
     def get_trip_info(self, trip_id: str) -> Optional[dict]:
         """
@@ -159,7 +414,9 @@ class GTFSStaticReader:
         Returns:
             Dictionary with trip info, or None if not found
         """
-        return self._trips.get(trip_id)
+        self._ensure_table('trips')
+        row = self._trips.get(trip_id)
+        return row._asdict() if row is not None else None
     
     def is_loaded(self) -> bool:
         """Check if GTFS data has been loaded."""
@@ -169,51 +426,89 @@ class GTFSStaticReader:
         """
         Get all available stops/stations.
         
+        The list is built and sorted once and shared between callers, so it
+        must not be modified.
+        
         Returns:
             List of dictionaries with stop information
         """
         if not self._loaded:
             return []
         
-        stops_list = []
-        for stop_id, stop_info in self._stops.items():
-            stops_list.append({
-                'stop_id': stop_id,
-                'stop_name': stop_info.get('stop_name', ''),
-                'stop_code': stop_info.get('stop_code', ''),
-                'stop_lat': stop_info.get('stop_lat', ''),
-                'stop_lon': stop_info.get('stop_lon', ''),
-                'wheelchair_boarding': stop_info.get('wheelchair_boarding', '')
-            })
-        
-        # Sort by stop name for easier browsing
-        stops_list.sort(key=lambda x: x['stop_name'])
-        return stops_list
+        if self._all_stops_sorted is None:
+            self._ensure_table('stops')
+            stops_list = [
+                {
+                    'stop_id': stop_id,
+                    'stop_name': row.stop_name,
+                    'stop_code': row.stop_code,
+                    'stop_lat': row.stop_lat,
+                    'stop_lon': row.stop_lon,
+                    'wheelchair_boarding': row.wheelchair_boarding
+                }
+                for stop_id, row in self._stops.items()
+            ]
+            
+            # Sort by stop name for easier browsing
+            stops_list.sort(key=lambda x: x['stop_name'])
+            self._all_stops_sorted = stops_list
+        
+        return self._all_stops_sorted
+    
+    def get_stop_choices(self) -> List[Tuple[str, str]]:
+        """
+        Get (stop_id, stop_name) pairs sorted by name, e.g. for a station picker.
+        
+        The list is built once and shared between callers, so it must not be
+        modified.
+        
+        Returns:
+            List of (stop_id, stop_name) tuples
+        """
+        if not self._loaded:
+            return []
+        
+        if self._stop_choices is None:
+            self._ensure_table('stops')
+            self._stop_choices = sorted(
+                ((stop_id, row.stop_name) for stop_id, row in self._stops.items()),
+                key=itemgetter(1)
+            )
+        
+        return self._stop_choices
     
     def get_all_routes(self) -> list:
         """
         Get all available routes/lines.
         
+        The list is built and sorted once and shared between callers, so it
+        must not be modified.
+        
         Returns:
             List of dictionaries with route information
         """
         if not self._loaded:
             return []
         
-        routes_list = []
-        for route_id, route_info in self._routes.items():
-            routes_list.append({
-                'route_id': route_id,
-                'route_long_name': route_info.get('route_long_name', ''),
-                'route_short_name': route_info.get('route_short_name', ''),
-                'route_color': route_info.get('route_color', ''),
-                'route_text_color': route_info.get('route_text_color', ''),
-                'route_type': route_info.get('route_type', '')
-            })
-        
-        # Sort by route ID for consistency
-        routes_list.sort(key=lambda x: x['route_id'])
-        return routes_list
+        if self._all_routes_sorted is None:
+            self._ensure_table('routes')
+            routes_list = [
+                {
+                    'route_id': route_id,
+                    'route_long_name': row.route_long_name,
+                    'route_short_name': row.route_short_name,
+                    'route_color': row.route_color,
+                    'route_text_color': row.route_text_color,
+                    'route_type': row.route_type
+                }
+                for route_id, row in self._routes.items()
+            ]
+            
+            # Sort by route ID for consistency
+            routes_list.sort(key=lambda x: x['route_id'])
+            self._all_routes_sorted = routes_list
+        
+        return self._all_routes_sorted
     
     def enrich_train_info(self, train_info: dict) -> dict:
         """
@@ -228,61 +523,87 @@ class GTFSStaticReader:
         if not self._loaded:
             return train_info
         
-        # Enrich route information
-        route_id = train_info.get('route_id')
-        if route_id:
-            route_info = self.get_route_info(route_id)
-            if route_info:
-                train_info['route_name'] = route_info.get('route_long_name', '')
-                train_info['route_color'] = route_info.get('route_color', '')
-                # NEW: Add additional route fields if available
-                if route_info.get('route_desc'):
-                    train_info['route_desc'] = route_info.get('route_desc', '')
-                if route_info.get('route_url'):
-                    train_info['route_url'] = route_info.get('route_url', '')
-        
-        # Enrich trip information
-        trip_id = train_info.get('trip_id')
-        if trip_id:
-            trip_info = self.get_trip_info(trip_id)
-            if trip_info:
-                train_info['trip_headsign'] = trip_info.get('trip_headsign', '')
-                train_info['direction_id'] = trip_info.get('direction_id', '')
-                # NEW: Add additional trip fields if available
-                if trip_info.get('wheelchair_accessible'):
-                    train_info['wheelchair_accessible'] = trip_info.get('wheelchair_accessible', '')
-                if trip_info.get('bikes_allowed'):
-                    train_info['bikes_allowed'] = trip_info.get('bikes_allowed', '')
-        
-        # Enrich current stop
-        current_stop = train_info.get('current_stop')
-        if current_stop:
-            stop_info = self.get_stop_info(current_stop)
-            if stop_info:
-                train_info['current_stop_name'] = stop_info.get('stop_name', '')
-                # NEW: Add platform code if available
-                if stop_info.get('platform_code'):
-                    train_info['current_platform_code'] = stop_info.get('platform_code', '')
-        
-        # Enrich next stop
-        next_stop = train_info.get('next_stop')
-        if next_stop:
-            stop_info = self.get_stop_info(next_stop)
-            if stop_info:
-                train_info['next_stop_name'] = stop_info.get('stop_name', '')
-                # NEW: Add platform code if available
-                if stop_info.get('platform_code'):
-                    train_info['next_platform_code'] = stop_info.get('platform_code', '')
-        
-        # Enrich all stops in the stops list
-        if 'stops' in train_info:
-            for stop in train_info['stops']:
-                stop_id = stop.get('stop_id')
-                if stop_id:
-                    stop_info = self.get_stop_info(stop_id)
-                    if stop_info:
-                        stop['stop_name'] = stop_info.get('stop_name', '')
-                        stop['stop_lat'] = stop_info.get('stop_lat', '')
-                        stop['stop_lon'] = stop_info.get('stop_lon', '')
-        
-        return train_info
+        return self.enrich_trains([train_info])[0]
+    
+    def enrich_trains(self, trains: list) -> list:
+        """
+        Enrich a batch of trains with GTFS static data.
+        
+        Table loading and lookup setup happen once for the whole batch rather
+        than once per train. Each train dictionary is updated in place.
+        
+        Args:
+            trains: List of dictionaries with basic train information
+            
+        Returns:
+            The same list, with each train enriched
+        """
+        if not self._loaded or not trains:
+            return trains
+        
+        for table in GTFS_TABLES:
+            self._ensure_table(table)
+        # Rows are looked up directly: one hash per table and field access on
+        # the stored tuple, without building a dict per lookup
+        get_route = self._routes.get
+        get_trip = self._trips.get
+        get_stop = self._stops.get
+        stop_location = _stop_location
+        
+        for train_info in trains:
+            # Enrich route information
+            route_id = train_info.get('route_id')
+            if route_id:
+                route = get_route(route_id)
+                if route:
+                    train_info['route_name'] = route.route_long_name
+                    train_info['route_color'] = route.route_color
+                    # NEW: Add additional route fields if available
+                    if route.route_desc:
+                        train_info['route_desc'] = route.route_desc
+                    if route.route_url:
+                        train_info['route_url'] = route.route_url
+            
+            # Enrich trip information
+            trip_id = train_info.get('trip_id')
+            if trip_id:
+                trip = get_trip(trip_id)
+                if trip:
+                    train_info['trip_headsign'] = trip.trip_headsign
+                    train_info['direction_id'] = trip.direction_id
+                    # NEW: Add additional trip fields if available
+                    if trip.wheelchair_accessible:
+                        train_info['wheelchair_accessible'] = trip.wheelchair_accessible
+                    if trip.bikes_allowed:
+                        train_info['bikes_allowed'] = trip.bikes_allowed
+            
+            # Enrich current stop
+            current_stop = train_info.get('current_stop')
+            if current_stop:
+                stop = get_stop(current_stop)
+                if stop:
+                    train_info['current_stop_name'] = stop.stop_name
+                    # NEW: Add platform code if available
+                    if stop.platform_code:
+                        train_info['current_platform_code'] = stop.platform_code
+            
+            # Enrich next stop
+            next_stop = train_info.get('next_stop')
+            if next_stop:
+                stop = get_stop(next_stop)
+                if stop:
+                    train_info['next_stop_name'] = stop.stop_name
+                    # NEW: Add platform code if available
+                    if stop.platform_code:
+                        train_info['next_platform_code'] = stop.platform_code
+            
+            # Enrich all stops in the stops list
+            stops = train_info.get('stops')
+            if stops:
+                # Resolve every stop in one pass before writing the results back
+                rows = map(get_stop, [stop.get('stop_id') for stop in stops])
+                for stop, row in zip(stops, rows):
+                    if row:
+                        stop['stop_name'], stop['stop_lat'], stop['stop_lon'] = stop_location(row)
+        
+        return trains
@@ -9,51 +9,153 @@ Handles all the logic for the main window GUI, including:
 - Train data visualization
 """
 
+import os
 import sys
+import signal
 import subprocess
+import time
 import logging
 import json
+import queue
+from hashlib import blake2b
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
 from PySide6.QtWidgets import (
     QMainWindow, QMessageBox, QFileDialog, QTableWidgetItem, QWidget, 
     QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidget, 
-    QHeaderView, QTextEdit, QGroupBox
+    QHeaderView, QTextEdit, QGroupBox, QTableView, QLineEdit, QSpinBox,
+    QPlainTextEdit
 )
-from PySide6.QtCore import QTimer, QThread, Signal, Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import (
+    QTimer, QThread, Signal, Qt, QMutex, QMutexLocker, QObject, QRunnable, QThreadPool,
+    QSocketNotifier, QUrl, QSortFilterProxyModel
+)
+from PySide6.QtGui import QBrush, QColor
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from src.gui.views.generated.main_window import Ui_MainWindow
+from src.gui.models.json_table_model import JsonTableModel
+from src.gui.models.train_table_model import TrainTableModel
 from src.gtfs_downloader import GTFSDownloader
 from src.shared.settings import GlobalSettings
+from src.shared.rate_limit import TokenBucket
 
 
 logger = logging.getLogger(__name__)
 
+# web_server.py in the project root, resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_WEB_SERVER_PATH = _PROJECT_ROOT / "web_server.py"
+
+# Alert effect cell backgrounds, shared by every row
+_EFFECT_BRUSHES = {
+    'SIGNIFICANT_DELAYS': QBrush(QColor(255, 200, 200)),  # Light red
+    'REDUCED_SERVICE': QBrush(QColor(255, 200, 200)),     # Light red
+    'DETOUR': QBrush(QColor(255, 255, 200)),              # Light yellow
+    'MODIFIED_SERVICE': QBrush(QColor(200, 220, 255)),    # Light blue
+}
+
+# Marker the server prints in front of each startup phase name
+_PHASE_TAG = "STARTUP_PHASE:"
+_PHASE_LEN = len(_PHASE_TAG)
+
+
+class StartupPhase(IntEnum):
+    """Server startup phases, in the order the server reports them"""
+    INITIALIZING = 0
+    GTFS_CHECK = 1
+    GTFS_DOWNLOAD = 2
+    GTFS_CHECK_COMPLETE = 3
+    GTFS_CHECK_SKIPPED = 4
+    CLIENT_INIT = 5
+    GTFS_LOAD = 6
+    SERVER_START = 7
+    READY = 8
+
+
+# (display text, progress percent) for each StartupPhase, indexed by its value
+_PHASE_TABLE = (
+    ('Initializing...', 0),
+    ('Checking GTFS data...', 20),
+    ('Downloading GTFS data...', 30),
+    ('GTFS check complete', 40),
+    ('GTFS check skipped', 40),
+    ('Initializing client...', 60),
+    ('Loading GTFS data...', 75),
+    ('Starting server...', 90),
+    ('Ready', 100),
+)
+_PHASE_BY_NAME = {phase.name: phase for phase in StartupPhase}
+
+
+@lru_cache(maxsize=2048)
+def _format_eta(eta):
+    """Format an ISO 8601 ETA as HH:MM:SS, returning it unchanged if it does not parse
+    
+    Cached because the same ETAs come back on every refresh.
+    """
+    try:
+        dt = datetime.fromisoformat(eta.replace('Z', '+00:00'))
+        return dt.strftime('%H:%M:%S')
+    except ValueError:
+        # Keep original value if parsing fails
+        return eta
+
+
+def _decode_json(response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    # orjson parses the raw bytes several times faster than the stdlib decoder
+    return orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+
+
+def _pretty_json(data):
+    """Format decoded JSON with two-space indentation for the text views"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 
 class ServerThread(QThread):
-    """Thread for running the web server process"""
+    """Thread for running the web server process
+    
+    Server output is put on ``log_queue`` as ``(level, lines)`` batches and
+    drained by the main window on a timer, rather than emitted line by line.
+    """
     
-    output_ready = Signal(str)
     error_ready = Signal(str)
     finished = Signal(int)
     startup_phase = Signal(str)  # Signal for startup phase updates
+    pidfd_ready = Signal(int)  # Linux: fd that becomes readable when the process exits
     
-    def __init__(self, host, port, api_key, debug, skip_gtfs):
+    # Maximum number of bytes taken from the server's stdout pipe per read
+    READ_BUFFER_SIZE = 65536
+    
+    def __init__(self, host, port, api_key, debug, skip_gtfs, log_queue, web_server_path=_WEB_SERVER_PATH):
         super().__init__()
         self.host = host
         self.port = port
         self.api_key = api_key
         self.debug = debug
         self.skip_gtfs = skip_gtfs
+        self.log_queue = log_queue
+        self.web_server_path = web_server_path
         self.process = None
         
     def run(self):
         """Run the web server process"""
-        # Find web_server.py in the project root
-        project_root = Path(__file__).parent.parent.parent.parent
-        web_server_path = project_root / "web_server.py"
+        web_server_path = self.web_server_path
         
         if not web_server_path.exists():
             # Try current working directory as fallback
@@ -63,7 +165,10 @@ class ServerThread(QThread):
                 self.finished.emit(-1)
                 return
         
-        cmd = [sys.executable, str(web_server_path), "--host", self.host, "--port", str(self.port)]
+        # -u keeps the child's stdout unbuffered: into a pipe Python would
+        # otherwise hold STARTUP_PHASE markers in an 8 KiB block buffer and
+        # deliver them in one burst long after each phase began.
+        cmd = [sys.executable, "-u", str(web_server_path), "--host", self.host, "--port", str(self.port)]
         
         if self.api_key:
             cmd.extend(["--api-key", self.api_key])
@@ -73,24 +178,37 @@ class ServerThread(QThread):
             cmd.append("--skip-gtfs-update")
             
         try:
+            # Run the server in its own process group so stop() also reaches
+            # any children it starts, such as the Werkzeug reloader in debug mode
+            if os.name == 'nt':
+                group_kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+            else:
+                group_kwargs = {'start_new_session': True}
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                bufsize=0,
+                **group_kwargs
             )
+            self._open_pidfd()
+            
+            # Read whatever output is available and queue its complete lines
+            # as one batch; a partial last line waits for the next chunk.
+            # os.read blocks without holding the GIL and returns as soon as
+            # any output arrives, so this thread needs no select() loop.
+            fd = self.process.stdout.fileno()
+            tail = b''
+            while True:
+                chunk = os.read(fd, self.READ_BUFFER_SIZE)
+                if not chunk:
+                    break
+                complete, newline, tail = (tail + chunk).rpartition(b'\n')
+                if newline:
+                    self._publish_output(complete)
+            if tail:
+                self._publish_output(tail)
             
-            # Read output line by line
-            for line in iter(self.process.stdout.readline, ''):
-                if line:
-                    stripped_line = line.rstrip()
-                    self.output_ready.emit(stripped_line)
-                    # Detect startup phase markers
-                    if "STARTUP_PHASE:" in stripped_line:
-                        phase = stripped_line.split("STARTUP_PHASE:")[-1].strip()
-                        self.startup_phase.emit(phase)
-                    
             exit_code = self.process.wait()
             self.finished.emit(exit_code)
             
@@ -98,69 +216,332 @@ class ServerThread(QThread):
             self.error_ready.emit(f"Failed to start server: {str(e)}")
             self.finished.emit(-1)
     
-    def stop(self):
-        """Stop the server process"""
+    def _publish_output(self, raw_output):
+        """Queue a block of complete output lines for the log and report startup phases
+        
+        The block is decoded in one call and split afterwards, so the
+        per-line work is only the split and strip.
+        """
+        lines = [line.rstrip() for line in raw_output.decode('utf-8', 'replace').split('\n')]
+        self.log_queue.put_nowait(("INFO", lines))
+        
+        # Detect startup phase markers
+        for stripped_line in lines:
+            idx = stripped_line.rfind(_PHASE_TAG)
+            if idx >= 0:
+                self.startup_phase.emit(stripped_line[idx + _PHASE_LEN:].strip())
+    
+    def _open_pidfd(self):
+        """Emit a pidfd for the server process where the platform supports it"""
+        if not hasattr(os, 'pidfd_open'):
+            return
+        try:
+            pidfd = os.pidfd_open(self.process.pid)
+        except OSError:
+            # Kernel older than 5.3; the exit is noticed when stdout closes
+            return
+        self.pidfd_ready.emit(pidfd)
+    
+    # Grace period between terminate() and kill()
+    STOP_TIMEOUT_MS = 5000
+    
+    def stop(self, wait=False):
+        """Stop the server process
+        
+        Args:
+            wait: Block until the process has exited. Otherwise return right
+                away and kill the process if it is still alive after
+                STOP_TIMEOUT_MS; ``finished`` is emitted once it exits.
+        """
         if self.process and self.process.poll() is None:
-            self.process.terminate()
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+            self._signal_process_group(terminate=True)
+            if wait:
+                try:
+                    self.process.wait(timeout=self.STOP_TIMEOUT_MS / 1000)
+                except subprocess.TimeoutExpired:
+                    self._signal_process_group(terminate=False)
+            else:
+                QTimer.singleShot(self.STOP_TIMEOUT_MS, self._kill_if_running)
+    
+    def _kill_if_running(self):
+        """Kill the server process if it ignored the terminate signal"""
+        if self.process and self.process.poll() is None:
+            self._signal_process_group(terminate=False)
+    
+    def _signal_process_group(self, terminate):
+        """Terminate or kill the server together with the processes it started
+        
+        Args:
+            terminate: Send a polite termination request instead of killing
+        """
+        if os.name == 'nt':
+            if terminate:
+                self.process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
                 self.process.kill()
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGTERM if terminate else signal.SIGKILL)
+        except ProcessLookupError:
+            # The whole group has already exited
+            pass
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a FetchWorker"""
+    
+    done = Signal(object, str, str)  # Decoded JSON payload, its ETag ('' if none), body digest
+    not_modified = Signal()          # 304 response, or a body identical to the known digest
+    elapsed = Signal(float)          # Seconds the server took to answer, sent before done/not_modified
+    failed = Signal(str, str)        # Short status for a label, error message for the log
+
+
+class FetchWorker(QRunnable):
+    """Runs an API GET request on the thread pool so the GUI never blocks on it"""
+    
+    def __init__(self, session, url, params=None, description="data", timeout=10,
+                 etag=None, digest=None):
+        super().__init__()
+        self.session = session
+        self.url = url
+        self.params = params
+        self.description = description
+        self.timeout = timeout
+        self.etag = etag
+        self.digest = digest
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Fetch the URL and emit the decoded payload or an error message"""
+        headers = {'If-None-Match': self.etag} if self.etag else None
+        try:
+            response = self.session.get(self.url, params=self.params, headers=headers,
+                                        timeout=self.timeout)
+            self.signals.elapsed.emit(response.elapsed.total_seconds())
+            if response.status_code == 304:
+                self.signals.not_modified.emit()
+                return
+            response.raise_for_status()
+            
+            # A byte-identical body needs neither decoding nor redrawing
+            digest = blake2b(response.content, digest_size=8).hexdigest()
+            if digest == self.digest:
+                self.signals.not_modified.emit()
+                return
+            
+            data = _decode_json(response)
+        except requests.ConnectionError:
+            self.signals.failed.emit("Connection error", "Cannot connect to server. Is it running?")
+        except requests.Timeout:
+            self.signals.failed.emit("Request timed out",
+                                     f"Request timed out while fetching {self.description}")
+        except Exception as e:
+            self.signals.failed.emit("Error fetching data",
+                                     f"Failed to fetch {self.description}: {str(e)}")
+        else:
+            self.signals.done.emit(data, response.headers.get('ETag', ''), digest)
+
+
+class TextWorkerSignals(QObject):
+    """Signals emitted by a TravelFetchWorker"""
+    
+    done = Signal(str, str)  # Endpoint URL, text to display for it
+
+
+class TravelFetchWorker(QRunnable):
+    """Fetches one travel endpoint on the thread pool and formats it for display
+    
+    Travel endpoints answer 503 when travel assistance is not configured, so
+    the result is always display text rather than a payload or an error.
+    """
+    
+    def __init__(self, session, url, params=None, timeout=10):
+        super().__init__()
+        self.session = session
+        self.url = url
+        self.params = params
+        self.timeout = timeout
+        self.signals = TextWorkerSignals()
+    
+    def run(self):
+        """Fetch the URL and emit the text to show for it"""
+        try:
+            response = self.session.get(self.url, params=self.params, timeout=self.timeout)
+            if response.status_code == 200:
+                text = _pretty_json(_decode_json(response))
+            elif response.status_code == 503:
+                data = _decode_json(response)
+                text = f"Not configured: {data.get('error', 'Unknown error')}"
+            else:
+                text = f"Error: HTTP {response.status_code}"
+        except Exception as e:
+            text = f"Error: {str(e)}"
+        self.signals.done.emit(self.url, text)
 
 
 class MainWindowController(QMainWindow):
     """Main window controller for the MNR Real-Time Service Manager"""
     
+    # How long log lines are collected before being written to the log view
+    LOG_FLUSH_INTERVAL_MS = 50
+    # How long startup phase markers are coalesced before updating the progress bar
+    PHASE_FLUSH_INTERVAL_MS = 50
+    
+    # Delay before the first health probe retry; doubled after each failure
+    HEALTH_RETRY_START_MS = 200
+    
+    # Initial train table column widths: Trip ID, Route, Current Stop, Next Stop, ETA, Track, Status
+    TRAIN_COLUMN_WIDTHS = (240, 120, 170, 170, 80, 60, 120)
+    
+    # Write buffer used when saving the log view to a file
+    SAVE_LOGS_BUFFER_SIZE = 1 << 20
+    # Log view lines joined into each write when saving
+    SAVE_LOGS_CHUNK_LINES = 1024
+    
+    # How long GTFS download info is reused before the status files are read again
+    GTFS_INFO_TTL = 60  # seconds
+    
+    # Characters of an alert description shown in its cell; the tooltip has the rest
+    ALERT_DESCRIPTION_CELL_CHARS = 200
+    
+    # How long stations and routes are reused before asking the server again;
+    # the server only reloads its static GTFS data when it restarts
+    STATIC_DATA_TTL = 300  # seconds
+    
+    # Client-side limit on refresh requests: a burst of REQUEST_BURST, then
+    # one request every 1 / REQUEST_RATE seconds
+    REQUEST_RATE = 0.5  # requests per second
+    REQUEST_BURST = 4
+    
+    # Auto-refresh backs off while train data is unchanged and speeds up when it moves
+    AUTO_REFRESH_START_MS = 10000
+    AUTO_REFRESH_MIN_MS = 5000
+    AUTO_REFRESH_MAX_MS = 60000
+    # A slow server raises the shortest interval: each millisecond the last
+    # train request took adds this many milliseconds to AUTO_REFRESH_MIN_MS
+    AUTO_REFRESH_LATENCY_FACTOR = 10
+    
     def __init__(self):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         
+        # Log lines are buffered and written to the log view in batches so
+        # bursts of server output cost one widget update per flush. The view
+        # keeps at most maximumBlockCount lines, so the buffer never needs more.
+        self._log_buf_max = self.ui.logsTextEdit.maximumBlockCount() or None
+        self._log_buf = deque(maxlen=self._log_buf_max)
+        self._log_lock = QMutex()
+        self._ts_cache = (0, "")  # (whole second, formatted timestamp)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        
+        # Server output arrives on a queue drained while the server runs
+        self.log_queue = queue.Queue()
+        self._log_drain_timer = QTimer(self)
+        self._log_drain_timer.timeout.connect(self._drain_log_queue)
+        
         # Initialize state
         self.server_thread = None
+        self._previous_server_thread = None
+        self._server_active = False
+        self._pidfd_notifier = None
+        self._stop_requested = False
+        self._restart_pending = False
         self.auto_refresh_timer = QTimer(self)
-        self.auto_refresh_timer.timeout.connect(self.refresh_train_data)
+        self.auto_refresh_timer.setSingleShot(True)
+        self.auto_refresh_timer.timeout.connect(self._auto_refresh_tick)
+        self._refresh_interval_ms = self.AUTO_REFRESH_START_MS
+        self._train_latency_ms = 0
+        self._train_data_hash = None
+        
+        # Keep connections to the local server alive between health checks and
+        # refreshes (one pool per host name used to reach it, sized for the
+        # four travel requests plus the other tabs' refreshes). Gateway errors
+        # are retried briefly; 503 is not, the server uses it to report that
+        # a feature is not configured.
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=(502, 504),
+                raise_on_status=False,
+            )
+        ))
+        
+        # Smooths out repeated Refresh clicks and overlapping tab refreshes
+        self._request_bucket = TokenBucket(self.REQUEST_RATE, self.REQUEST_BURST)
+        
+        # Train data is fetched on the thread pool, one request at a time
+        self._fetch_in_flight = False
+        # Travel endpoints still being fetched by the current travel refresh
+        self._travel_pending = 0
+        # Text boxes of the travel endpoints, keyed by URL, for the current refresh
+        self._travel_views = {}
+        # Responses that arrived while their tab was hidden, shown when it is opened
+        self._hidden_travel_texts = {}  # text box -> text
+        self._hidden_api_info = None    # decoded API info payload
+        # Filters of the last vehicle and alert requests, for their status labels
+        self._vehicle_filters_str = ""
+        self._alert_filters_str = ""
+        # When stations and routes were last fetched, and the lists on screen
+        self._stations_fetched_at = None
+        self._stations_shown = None
+        self._routes_fetched_at = None
+        self._routes_shown = None
+        self._train_filters_str = ""
+        
+        # Validator of the last /trains response so unchanged data comes back as a 304
+        self._train_etag = None
+        self._train_timestamp = 'Unknown'
+        # Digest of the last body shown, a backstop for servers without ETags
+        self._train_digest = None
         
         # Startup tracking
-        self.startup_phases = {
-            'INITIALIZING': {'order': 0, 'display': 'Initializing...', 'progress': 0},
-            'GTFS_CHECK': {'order': 1, 'display': 'Checking GTFS data...', 'progress': 20},
-            'GTFS_DOWNLOAD': {'order': 2, 'display': 'Downloading GTFS data...', 'progress': 30},
-            'GTFS_CHECK_COMPLETE': {'order': 3, 'display': 'GTFS check complete', 'progress': 40},
-            'GTFS_CHECK_SKIPPED': {'order': 3, 'display': 'GTFS check skipped', 'progress': 40},
-            'CLIENT_INIT': {'order': 4, 'display': 'Initializing client...', 'progress': 60},
-            'GTFS_LOAD': {'order': 5, 'display': 'Loading GTFS data...', 'progress': 75},
-            'SERVER_START': {'order': 6, 'display': 'Starting server...', 'progress': 90},
-            'READY': {'order': 7, 'display': 'Ready', 'progress': 100}
-        }
         self.current_startup_phase = None
         self.startup_start_time = None
         self.phase_times = {}  # Track time spent in each phase
         
-        # Health check timer
+        # Bursts of phase markers are coalesced into one widget update
+        self._pending_phase = None
+        self._phase_flush = QTimer(self)
+        self._phase_flush.setSingleShot(True)
+        self._phase_flush.setInterval(self.PHASE_FLUSH_INTERVAL_MS)
+        self._phase_flush.timeout.connect(self._apply_phase)
+        
+        # Health check retry timer; the first probe is sent as soon as the
+        # server reports READY and failures are retried with backoff
         self.health_check_timer = QTimer(self)
+        self.health_check_timer.setSingleShot(True)
         self.health_check_timer.timeout.connect(self.check_server_health)
         self.health_check_attempts = 0
-        self.max_health_check_attempts = 20
+        self.max_health_check_attempts = 5
+        self._health_retry_ms = self.HEALTH_RETRY_START_MS
+        self._health_url = None
+        # Health probes are asynchronous Qt network requests, at most one at a time
+        self._nam = QNetworkAccessManager(self)
+        self._health_reply = None
         
         # Connect signals
         self._connect_signals()
         
-        # Initialize GTFS downloader
-        self.gtfs_downloader = GTFSDownloader(
-            gtfs_url=GlobalSettings.GTFSDownloadSettings.GTFS_FEED_URL,
-            output_dir=GlobalSettings.GTFS_MNR_DATA_DIR,
-            min_download_interval=GlobalSettings.GTFSDownloadSettings.MIN_DOWNLOAD_INTERVAL
-        )
-        
-        # Update GTFS info
-        self.update_gtfs_info()
+        # The GTFS downloader reads disk state, so it is created once the
+        # window has been painted (see _late_init)
+        self.gtfs_downloader = None
+        self._gtfs_info_cache = None
+        self._gtfs_info_ts = 0.0
+        QTimer.singleShot(0, self._late_init)
         
         # Add new tabs for all endpoints
         self._setup_additional_tabs()
         
         # Enhance the trains tab with additional filters
         self._enhance_trains_tab()
+        self._setup_train_table()
         
         # Log initial message
         self.log_message("GUI initialized. Ready to start server.", "INFO")
@@ -192,9 +573,56 @@ class MainWindowController(QMainWindow):
         self.ui.actionAbout.triggered.connect(self.show_about)
     
     def _setup_additional_tabs(self):
-        """Setup additional tabs for viewing all API endpoints"""
-        # Stations Tab
+        """Setup additional tabs for viewing all API endpoints
+        
+        Only empty pages are added here; each tab's widgets are created by
+        its _build_*_tab method the first time the tab is shown.
+        """
         self.stationsTab = QWidget()
+        self.ui.tabWidget.addTab(self.stationsTab, "Stations")
+        self.routesTab = QWidget()
+        self.ui.tabWidget.addTab(self.routesTab, "Routes")
+        self.travelTab = QWidget()
+        self.ui.tabWidget.addTab(self.travelTab, "Travel Assistance")
+        self.vehiclePositionsTab = QWidget()
+        self.ui.tabWidget.addTab(self.vehiclePositionsTab, "Vehicle Positions")
+        self.alertsTab = QWidget()
+        self.ui.tabWidget.addTab(self.alertsTab, "Alerts")
+        self.apiInfoTab = QWidget()
+        self.ui.tabWidget.addTab(self.apiInfoTab, "API Information")
+        
+        self._tab_builders = {
+            self.stationsTab: self._build_stations_tab,
+            self.routesTab: self._build_routes_tab,
+            self.travelTab: self._build_travel_tab,
+            self.vehiclePositionsTab: self._build_vehicle_positions_tab,
+            self.alertsTab: self._build_alerts_tab,
+            self.apiInfoTab: self._build_api_info_tab,
+        }
+        self.ui.tabWidget.currentChanged.connect(self._materialize_tab)
+        self.ui.tabWidget.currentChanged.connect(self._show_hidden_results)
+    
+    def _materialize_tab(self, index):
+        """Build a lazily created tab the first time it becomes current"""
+        builder = self._tab_builders.pop(self.ui.tabWidget.widget(index), None)
+        if builder is not None:
+            builder()
+        if not self._tab_builders:
+            self.ui.tabWidget.currentChanged.disconnect(self._materialize_tab)
+    
+    def _show_hidden_results(self, index):
+        """Render travel or API info responses that arrived while their tab was hidden"""
+        page = self.ui.tabWidget.widget(index)
+        if page is self.travelTab and self._hidden_travel_texts:
+            pending, self._hidden_travel_texts = self._hidden_travel_texts, {}
+            for text_edit, text in pending.items():
+                text_edit.setPlainText(text)
+        elif page is self.apiInfoTab and self._hidden_api_info is not None:
+            data, self._hidden_api_info = self._hidden_api_info, None
+            self.apiInfoText.setPlainText(_pretty_json(data))
+    
+    def _build_stations_tab(self):
+        """Create the Stations tab contents"""
         self.stationsTabLayout = QVBoxLayout(self.stationsTab)
         
         # Stations controls
@@ -218,11 +646,9 @@ class MainWindowController(QMainWindow):
         self.stationsTable.setSelectionBehavior(QTableWidget.SelectRows)
         self.stationsTable.setAlternatingRowColors(True)
         self.stationsTabLayout.addWidget(self.stationsTable)
-        
-        self.ui.tabWidget.addTab(self.stationsTab, "Stations")
-        
-        # Routes Tab
-        self.routesTab = QWidget()
+    
+    def _build_routes_tab(self):
+        """Create the Routes tab contents"""
         self.routesTabLayout = QVBoxLayout(self.routesTab)
         
         # Routes controls
@@ -246,11 +672,9 @@ class MainWindowController(QMainWindow):
         self.routesTable.setSelectionBehavior(QTableWidget.SelectRows)
         self.routesTable.setAlternatingRowColors(True)
         self.routesTabLayout.addWidget(self.routesTable)
-        
-        self.ui.tabWidget.addTab(self.routesTab, "Routes")
-        
-        # Travel Assistance Tab
-        self.travelTab = QWidget()
+    
+    def _build_travel_tab(self):
+        """Create the Travel Assistance tab contents"""
         self.travelTabLayout = QVBoxLayout(self.travelTab)
         
         # Travel controls and filters
@@ -332,11 +756,9 @@ class MainWindowController(QMainWindow):
         arduinoLayout.addWidget(self.arduinoText)
         arduinoGroup.setLayout(arduinoLayout)
         self.travelTabLayout.addWidget(arduinoGroup)
-        
-        self.ui.tabWidget.addTab(self.travelTab, "Travel Assistance")
-        
-        # Vehicle Positions Tab
-        self.vehiclePositionsTab = QWidget()
+    
+    def _build_vehicle_positions_tab(self):
+        """Create the Vehicle Positions tab contents"""
         self.vehiclePositionsTabLayout = QVBoxLayout(self.vehiclePositionsTab)
         
         # Vehicle positions controls
@@ -376,22 +798,20 @@ class MainWindowController(QMainWindow):
         self.vehiclePositionsTabLayout.addLayout(vehiclePositionsControlLayout)
         
         # Vehicle positions table
-        self.vehiclePositionsTable = QTableWidget()
-        self.vehiclePositionsTable.setColumnCount(9)
-        self.vehiclePositionsTable.setHorizontalHeaderLabels([
+        self.vehiclePositionsModel = JsonTableModel([
             "Vehicle ID", "Trip ID", "Route", "Latitude", "Longitude", 
             "Bearing", "Speed", "Stop ID", "Status"
-        ])
+        ], self)
+        self.vehiclePositionsTable = QTableView()
+        self.vehiclePositionsTable.setModel(self.vehiclePositionsModel)
         self.vehiclePositionsTable.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.vehiclePositionsTable.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.vehiclePositionsTable.setSelectionBehavior(QTableWidget.SelectRows)
+        self.vehiclePositionsTable.setEditTriggers(QTableView.NoEditTriggers)
+        self.vehiclePositionsTable.setSelectionBehavior(QTableView.SelectRows)
         self.vehiclePositionsTable.setAlternatingRowColors(True)
         self.vehiclePositionsTabLayout.addWidget(self.vehiclePositionsTable)
-        
-        self.ui.tabWidget.addTab(self.vehiclePositionsTab, "Vehicle Positions")
-        
-        # Alerts Tab
-        self.alertsTab = QWidget()
+    
+    def _build_alerts_tab(self):
+        """Create the Alerts tab contents"""
         self.alertsTabLayout = QVBoxLayout(self.alertsTab)
         
         # Alerts controls
@@ -433,11 +853,9 @@ class MainWindowController(QMainWindow):
         self.alertsTable.setAlternatingRowColors(True)
         self.alertsTable.verticalHeader().setVisible(True)
         self.alertsTabLayout.addWidget(self.alertsTable)
-        
-        self.ui.tabWidget.addTab(self.alertsTab, "Alerts")
-        
-        # API Info Tab
-        self.apiInfoTab = QWidget()
+    
+    def _build_api_info_tab(self):
+        """Create the API Information tab contents"""
         self.apiInfoTabLayout = QVBoxLayout(self.apiInfoTab)
         
         # API info controls
@@ -450,12 +868,11 @@ class MainWindowController(QMainWindow):
         apiInfoControlLayout.addWidget(self.apiInfoStatusLabel)
         self.apiInfoTabLayout.addLayout(apiInfoControlLayout)
         
-        # API info display
-        self.apiInfoText = QTextEdit()
+        # API info display; plain text only, so skip the rich text document
+        self.apiInfoText = QPlainTextEdit()
         self.apiInfoText.setReadOnly(True)
+        self.apiInfoText.setUndoRedoEnabled(False)
         self.apiInfoTabLayout.addWidget(self.apiInfoText)
-        
-        self.ui.tabWidget.addTab(self.apiInfoTab, "API Information")
     
     def _enhance_trains_tab(self):
         """Add additional filter controls to the trains/data tab"""
@@ -499,6 +916,66 @@ class MainWindowController(QMainWindow):
         # Insert after the first control row (limit/refresh) but before the status label
         self.ui.dataTab.layout().insertWidget(1, filtersGroup)
     
+    def _setup_train_table(self):
+        """Attach the train model and give the table fixed geometry
+        
+        The proxy sorts rows when a header is clicked and keeps them sorted
+        as the model's rows change. Fixed geometry means refreshes never
+        re-measure cells.
+        """
+        table = self.ui.trainTableView
+        self._train_model = TrainTableModel(self)
+        self._train_proxy = QSortFilterProxyModel(self)
+        self._train_proxy.setSourceModel(self._train_model)
+        table.setModel(self._train_proxy)
+        
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        for column, width in enumerate(self.TRAIN_COLUMN_WIDTHS):
+            table.setColumnWidth(column, width)
+        
+        rows = table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(table.fontMetrics().height() + 8)
+    
+    def _bulk_fill(self, table, rows):
+        """Replace the contents of a table in one pass
+        
+        Sorting, repaints and the table's item signals are suspended and the
+        row count is set once, so filling costs one layout instead of one per
+        inserted row.
+        
+        Args:
+            table: QTableWidget to fill
+            rows: Sequence of rows; each cell is a display string or a
+                prepared QTableWidgetItem
+        
+        Returns:
+            True if the number of rows changed
+        """
+        # Locals for the per-cell loop, which runs once per cell
+        make_item = QTableWidgetItem
+        set_item = table.setItem
+        
+        row_count_changed = table.rowCount() != len(rows)
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        signals_blocked = table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
+            for r, row in enumerate(rows):
+                for c, value in enumerate(row):
+                    if not isinstance(value, make_item):
+                        value = make_item(value)
+                    set_item(r, c, value)
+        finally:
+            table.blockSignals(signals_blocked)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_enabled)
+        return row_count_changed
+    
     def clear_train_filters(self):
         """Clear all train filter fields"""
         self.trainRouteEdit.clear()
@@ -515,31 +992,90 @@ class MainWindowController(QMainWindow):
         self.log_message("Cleared travel filters", "INFO")
     
     def log_message(self, message, level="INFO"):
-        """Add a message to the log display"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted_message = f"[{timestamp}] [{level}] {message}"
+        """Queue a message for the log display"""
+        # Formatting is deferred to _flush_logs
+        with QMutexLocker(self._log_lock):
+            self._log_buf.append((level, message, time.time()))
+        
+        # The first message of a batch schedules the flush
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start(self.LOG_FLUSH_INTERVAL_MS)
+    
+    def _drain_log_queue(self):
+        """Move server output queued by the server thread into the log buffer"""
+        batch = []
+        while True:
+            try:
+                batch.append(self.log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        
+        now = time.time()
+        with QMutexLocker(self._log_lock):
+            for level, lines in batch:
+                self._log_buf.extend((level, line, now) for line in lines)
+        self._flush_logs()
+    
+    def _flush_logs(self):
+        """Write all buffered log messages to the log display in one update"""
+        with QMutexLocker(self._log_lock):
+            if not self._log_buf:
+                return
+            batch, self._log_buf = self._log_buf, deque(maxlen=self._log_buf_max)
+        
+        # Only follow new output if the view was already at the bottom, so
+        # reading older lines is not interrupted
+        scrollbar = self.ui.logsTextEdit.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        
+        # Format the batch; strftime only runs when the second changes
+        cached_second, timestamp = self._ts_cache
+        lines = []
+        for level, message, created in batch:
+            second = int(created)
+            if second != cached_second:
+                cached_second = second
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            lines.append(f"[{timestamp}] [{level}] {message}")
+        self._ts_cache = (cached_second, timestamp)
         
         # Add to log widget
-        self.ui.logsTextEdit.append(formatted_message)
+        self.ui.logsTextEdit.appendPlainText("\n".join(lines))
         
         # Auto-scroll if enabled
-        if self.ui.autoScrollCheckBox.isChecked():
-            scrollbar = self.ui.logsTextEdit.verticalScrollBar()
+        if at_bottom and self.ui.autoScrollCheckBox.isChecked():
             scrollbar.setValue(scrollbar.maximum())
     
     def update_startup_phase(self, phase):
+        """Queue a startup phase for display
+        
+        Only the latest phase is kept; _apply_phase shows it once the flush
+        timer fires, so a burst of markers costs a single repaint.
+        """
+        phase = _PHASE_BY_NAME.get(phase)
+        if phase is None:
+            return
+        self._pending_phase = phase
+        if not self._phase_flush.isActive():
+            self._phase_flush.start()
+    
+    def _apply_phase(self):
         """Update the startup phase display and progress bar"""
-        if phase not in self.startup_phases:
+        phase = self._pending_phase
+        if phase is None:
             return
+        self._pending_phase = None
         
-        phase_info = self.startup_phases[phase]
+        display, progress = _PHASE_TABLE[phase]
         self.current_startup_phase = phase
         
         # Update phase label
-        self.ui.startupPhaseValue.setText(phase_info['display'])
+        self.ui.startupPhaseValue.setText(display)
         
         # Update progress bar
-        self.ui.startupProgressBar.setValue(phase_info['progress'])
+        self.ui.startupProgressBar.setValue(progress)
         
         # Track timing for estimation
         current_time = datetime.now()
@@ -548,10 +1084,10 @@ class MainWindowController(QMainWindow):
             self.phase_times[phase] = elapsed
             
             # Estimate remaining time for phases < 100%
-            if phase_info['progress'] < 100:
+            if progress < 100:
                 # Simple estimation: assume remaining phases take similar time
-                avg_time_per_percent = elapsed / phase_info['progress'] if phase_info['progress'] > 0 else 0
-                remaining_percent = 100 - phase_info['progress']
+                avg_time_per_percent = elapsed / progress if progress > 0 else 0
+                remaining_percent = 100 - progress
                 estimated_remaining = avg_time_per_percent * remaining_percent
                 # Cap the estimate to a maximum of 60 seconds to avoid unrealistic values
                 estimated_remaining = min(estimated_remaining, 60)
@@ -563,47 +1099,76 @@ class MainWindowController(QMainWindow):
             else:
                 self.ui.startupProgressBar.setFormat("%p%")
         
-        # If server is ready, start health checks
-        if phase == 'READY':
+        # If server is ready, probe it once; failures are retried with backoff
+        if phase is StartupPhase.READY:
             self.log_message("Server reports ready, verifying health...", "INFO")
             self.health_check_attempts = 0
-            self.health_check_timer.start(500)  # Check every 500ms
+            self._health_retry_ms = self.HEALTH_RETRY_START_MS
+            self.check_server_health()
     
     def check_server_health(self):
-        """Check if the server is actually responding to requests"""
+        """Check if the server is actually responding to requests
+        
+        Sends an asynchronous probe to /health; _on_health_reply handles the
+        answer, so the GUI never waits on the network.
+        """
+        if self._health_reply is not None:
+            # The previous probe has not answered yet
+            return
         self.health_check_attempts += 1
         
-        # Get the server host and port
-        host = self.ui.hostEdit.text()
-        if host == "0.0.0.0":
-            host = "localhost"
-        port = self.ui.portSpinBox.value()
+        # Try to hit the health endpoint
+        request = QNetworkRequest(QUrl(self._health_url))
+        request.setTransferTimeout(2000)
+        reply = self._nam.get(request)
+        reply.finished.connect(self._on_health_reply)
+        self._health_reply = reply
+    
+    def _on_health_reply(self):
+        """Handle the answer to a health probe"""
+        reply = self.sender()
+        reply.deleteLater()
+        if reply is not self._health_reply:
+            # Probe was cancelled
+            return
+        self._health_reply = None
         
-        try:
-            # Try to hit the health endpoint
-            response = requests.get(f"http://{host}:{port}/health", timeout=2)
-            
-            if response.status_code == 200:
-                # Server is healthy!
-                self.health_check_timer.stop()
-                self.on_server_ready()
-                self.log_message("✓ Server health check passed - server is running", "INFO")
-            else:
-                self.log_message(f"Server responded with status {response.status_code}", "WARNING")
-                if self.health_check_attempts >= self.max_health_check_attempts:
-                    self.health_check_timer.stop()
-                    self.log_message("Health check timeout - server may not be responding correctly", "WARNING")
-                    self.on_server_ready()  # Continue anyway
-                    
-        except requests.ConnectionError:
-            if self.health_check_attempts >= self.max_health_check_attempts:
-                self.health_check_timer.stop()
-                self.log_message("Health check timeout - could not connect to server", "WARNING")
-                # Don't mark as ready since we couldn't connect
-        except Exception as e:
-            self.log_message(f"Health check error: {str(e)}", "WARNING")
-            if self.health_check_attempts >= self.max_health_check_attempts:
-                self.health_check_timer.stop()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        error = reply.error()
+        
+        if status == 200:
+            # Server is healthy!
+            self.on_server_ready()
+            self.log_message("✓ Server health check passed - server is running", "INFO")
+            return
+        
+        connect_failed = status is None and error in (
+            QNetworkReply.NetworkError.ConnectionRefusedError,
+            QNetworkReply.NetworkError.RemoteHostClosedError,
+            QNetworkReply.NetworkError.HostNotFoundError,
+        )
+        if status is not None:
+            self.log_message(f"Server responded with status {status}", "WARNING")
+        elif not connect_failed:
+            self.log_message(f"Health check error: {reply.errorString()}", "WARNING")
+        
+        if self.health_check_attempts < self.max_health_check_attempts:
+            # The server may still be binding its socket; try again later
+            self.health_check_timer.start(self._health_retry_ms)
+            self._health_retry_ms *= 2
+        elif status is not None:
+            self.log_message("Health check timeout - server may not be responding correctly", "WARNING")
+            self.on_server_ready()  # Continue anyway
+        elif connect_failed:
+            # Don't mark as ready since we couldn't connect
+            self.log_message("Health check timeout - could not connect to server", "WARNING")
+    
+    def _stop_health_checks(self):
+        """Stop health checks and cancel a probe that is still in flight"""
+        self.health_check_timer.stop()
+        reply, self._health_reply = self._health_reply, None
+        if reply is not None:
+            reply.abort()
     
     def on_server_ready(self):
         """Called when server is confirmed to be ready and responding"""
@@ -621,7 +1186,7 @@ class MainWindowController(QMainWindow):
     
     def start_server(self):
         """Start the web server"""
-        if self.server_thread and self.server_thread.isRunning():
+        if self._server_active:
             self.log_message("Server is already running", "WARNING")
             return
         
@@ -634,6 +1199,14 @@ class MainWindowController(QMainWindow):
         
         self.log_message(f"Starting server on {host}:{port}...", "INFO")
         
+        # Health checks go to the address the server was started with
+        health_host = "localhost" if host == "0.0.0.0" else host
+        self._health_url = f"http://{health_host}:{port}/health"
+        
+        # A new server may have loaded different static data
+        self._stations_fetched_at = None
+        self._routes_fetched_at = None
+        
         # Initialize startup tracking
         self.startup_start_time = datetime.now()
         self.phase_times = {}
@@ -645,12 +1218,17 @@ class MainWindowController(QMainWindow):
         self.ui.startupPhaseValue.setText("Initializing...")
         
         # Create and start server thread
-        self.server_thread = ServerThread(host, port, api_key, debug, skip_gtfs)
-        self.server_thread.output_ready.connect(self.log_message)
+        self._stop_requested = False
+        self._server_active = True
+        # The previous reader thread may still be flushing output; keep it alive
+        self._previous_server_thread = self.server_thread
+        self.server_thread = ServerThread(host, port, api_key, debug, skip_gtfs, self.log_queue)
         self.server_thread.error_ready.connect(lambda msg: self.log_message(msg, "ERROR"))
-        self.server_thread.finished.connect(self.on_server_finished)
+        self.server_thread.finished.connect(self._on_server_thread_finished)
         self.server_thread.startup_phase.connect(self.update_startup_phase)
+        self.server_thread.pidfd_ready.connect(self._watch_server_pidfd)
         self.server_thread.start()
+        self._log_drain_timer.start(self.LOG_FLUSH_INTERVAL_MS)
         
         # Update UI to show starting
         self.ui.serverStatusValue.setText("Starting...")
@@ -661,46 +1239,94 @@ class MainWindowController(QMainWindow):
     
     def stop_server(self):
         """Stop the web server"""
-        if not self.server_thread or not self.server_thread.isRunning():
+        if not self._server_active:
             self.log_message("Server is not running", "WARNING")
             return
         
         self.log_message("Stopping server...", "INFO")
         
-        # Stop health check timer if running
-        if self.health_check_timer.isActive():
-            self.health_check_timer.stop()
+        # Stop health checks if running
+        self._stop_health_checks()
         
+        # Returns immediately; on_server_finished updates the UI once the process exits
+        self._stop_requested = True
         self.server_thread.stop()
-        self.server_thread.wait()
         
-        # Update UI
-        self.ui.serverStatusValue.setText("Stopped")
-        self.ui.serverStatusValue.setStyleSheet("color: red; font-weight: bold;")
-        self.ui.startupPhaseValue.setText("N/A")
-        self.ui.startupProgressBar.setVisible(False)
-        self.ui.startButton.setEnabled(True)
+        self.ui.serverStatusValue.setText("Stopping...")
+        self.ui.serverStatusValue.setStyleSheet("color: orange; font-weight: bold;")
         self.ui.stopButton.setEnabled(False)
         self.ui.restartButton.setEnabled(False)
-        
-        self.log_message("Server stopped", "INFO")
     
     def restart_server(self):
         """Restart the web server"""
         self.log_message("Restarting server...", "INFO")
+        if not self._server_active:
+            self.start_server()
+            return
+        
+        # Start again as soon as the current process has exited
+        self._restart_pending = True
         self.stop_server()
-        QTimer.singleShot(1000, self.start_server)  # Wait 1 second before restarting
+    
+    def _watch_server_pidfd(self, pidfd):
+        """Report the server exit as soon as the kernel marks the process dead"""
+        self._close_pidfd_notifier()
+        notifier = QSocketNotifier(pidfd, QSocketNotifier.Type.Read, self)
+        notifier.activated.connect(self._on_server_pidfd_activated)
+        self._pidfd_notifier = notifier
+    
+    def _on_server_pidfd_activated(self):
+        """Handle the server process exiting, before its output has been drained"""
+        self._close_pidfd_notifier()
+        process = self.server_thread.process if self.server_thread else None
+        if process is not None:
+            # The process is already dead, so this only collects the exit code
+            self.on_server_finished(process.wait())
+    
+    def _close_pidfd_notifier(self):
+        """Stop watching the server pidfd and close it"""
+        notifier = self._pidfd_notifier
+        if notifier is None:
+            return
+        self._pidfd_notifier = None
+        notifier.setEnabled(False)
+        os.close(notifier.socket())
+        notifier.deleteLater()
+    
+    def _on_server_thread_finished(self, exit_code):
+        """Handle the server thread reaching the end of the server output"""
+        if self.sender() is not self.server_thread:
+            # A previous server's reader finishing after a restart
+            return
+        
+        # Pick up the last lines of output before reporting the exit
+        self._log_drain_timer.stop()
+        self._drain_log_queue()
+        self.on_server_finished(exit_code)
     
     def on_server_finished(self, exit_code):
-        """Handle server process finishing"""
-        # Stop health check timer if running
-        if self.health_check_timer.isActive():
-            self.health_check_timer.stop()
+        """Handle server process finishing
+        
+        Called from the pidfd watcher where available, otherwise when the
+        server thread sees stdout close; whichever comes first wins.
+        """
+        if not self._server_active:
+            return
+        self._server_active = False
+        self._close_pidfd_notifier()
+        self._phase_flush.stop()
+        self._pending_phase = None
         
-        if exit_code != 0:
+        # Stop health checks if running
+        self._stop_health_checks()
+        
+        if self._stop_requested:
+            self.log_message("Server stopped", "INFO")
+        elif exit_code != 0:
             self.log_message(f"Server exited with code {exit_code}", "ERROR")
         else:
             self.log_message("Server exited normally", "INFO")
+        self._stop_requested = False
         
         # Update UI
         self.ui.serverStatusValue.setText("Stopped")
@@ -710,6 +1336,10 @@ class MainWindowController(QMainWindow):
         self.ui.startButton.setEnabled(True)
         self.ui.stopButton.setEnabled(False)
         self.ui.restartButton.setEnabled(False)
+        
+        if self._restart_pending:
+            self._restart_pending = False
+            self.start_server()
     
     def apply_configuration(self):
         """Apply configuration changes"""
@@ -720,9 +1350,25 @@ class MainWindowController(QMainWindow):
             "Configuration has been updated. Restart the server for changes to take effect."
         )
     
+    def _late_init(self):
+        """Create the GTFS downloader and show its status after the first paint"""
+        self.gtfs_downloader = GTFSDownloader(
+            gtfs_url=GlobalSettings.GTFSDownloadSettings.GTFS_FEED_URL,
+            output_dir=GlobalSettings.GTFS_MNR_DATA_DIR,
+            min_download_interval=GlobalSettings.GTFSDownloadSettings.MIN_DOWNLOAD_INTERVAL
+        )
+        self.update_gtfs_info()
+    
+    def _gtfs_downloader_ready(self):
+        """Return True if the GTFS downloader exists, logging a notice otherwise"""
+        if self.gtfs_downloader is None:
+            self.log_message("GTFS manager is still initializing, please try again", "WARNING")
+            return False
+        return True
+    
     def update_gtfs_info(self):
         """Update GTFS download information display"""
-        info = self.gtfs_downloader.get_download_info()
+        info = self._get_gtfs_info()
         
         if info['last_download']:
             last_download_str = f"Last Download: {info['last_download']}"
@@ -736,8 +1382,18 @@ class MainWindowController(QMainWindow):
         # Enable/disable update button based on rate limit
         self.ui.updateGtfsButton.setEnabled(info['can_download_now'])
     
+    def _get_gtfs_info(self):
+        """Return GTFS download info, reading it from disk at most once per GTFS_INFO_TTL"""
+        now = time.monotonic()
+        if self._gtfs_info_cache is None or now - self._gtfs_info_ts > self.GTFS_INFO_TTL:
+            self._gtfs_info_cache = self.gtfs_downloader.get_download_info()
+            self._gtfs_info_ts = now
+        return self._gtfs_info_cache
+    
     def update_gtfs_data(self):
         """Update GTFS data (respecting rate limits)"""
+        if not self._gtfs_downloader_ready():
+            return
         if not self.gtfs_downloader.should_download():
             info = self.gtfs_downloader.get_download_info()
             hours_remaining = info.get('next_download_allowed_in_hours', 0)
@@ -753,6 +1409,8 @@ class MainWindowController(QMainWindow):
     
     def force_update_gtfs_data(self):
         """Force update GTFS data (bypass rate limits)"""
+        if not self._gtfs_downloader_ready():
+            return
         reply = QMessageBox.question(
             self,
             "Force Update",
@@ -793,10 +1451,14 @@ class MainWindowController(QMainWindow):
                 f"Failed to update GTFS data:\n{str(e)}"
             )
         finally:
+            # The download changed the status files, read them again
+            self._gtfs_info_cache = None
             self.update_gtfs_info()
     
     def clear_logs(self):
         """Clear the log display"""
+        with QMutexLocker(self._log_lock):
+            self._log_buf.clear()
         self.ui.logsTextEdit.clear()
         self.log_message("Logs cleared", "INFO")
     
@@ -810,17 +1472,47 @@ class MainWindowController(QMainWindow):
         )
         
         if file_path:
+            # Include server output still queued and anything waiting in the log buffer
+            self._drain_log_queue()
+            self._flush_logs()
             try:
-                with open(file_path, 'w') as f:
-                    f.write(self.ui.logsTextEdit.toPlainText())
+                # Stream the document in chunks of lines rather than copying
+                # it into one string with toPlainText()
+                with open(file_path, 'w', encoding='utf-8', buffering=self.SAVE_LOGS_BUFFER_SIZE) as f:
+                    f.writelines(self._iter_log_chunks())
                 self.log_message(f"Logs saved to {file_path}", "INFO")
                 QMessageBox.information(self, "Success", f"Logs saved to:\n{file_path}")
             except Exception as e:
                 self.log_message(f"Failed to save logs: {str(e)}", "ERROR")
                 QMessageBox.critical(self, "Error", f"Failed to save logs:\n{str(e)}")
     
+    def _iter_log_chunks(self):
+        """Yield the lines of the log view in order, SAVE_LOGS_CHUNK_LINES per string
+        
+        Joining lines keeps the number of write and encode calls small while
+        only one chunk of the log is ever copied at a time.
+        """
+        chunk_lines = self.SAVE_LOGS_CHUNK_LINES
+        lines = []
+        append = lines.append
+        block = self.ui.logsTextEdit.document().firstBlock()
+        while block.isValid():
+            append(block.text())
+            if len(lines) == chunk_lines:
+                lines.append('')
+                yield '\n'.join(lines)
+                lines.clear()
+            block = block.next()
+        if lines:
+            lines.append('')
+            yield '\n'.join(lines)
+    
     def refresh_train_data(self):
-        """Refresh train data from the API"""
+        """Refresh train data from the API
+        
+        The request runs on the thread pool; the table is updated by
+        _apply_train_data once the response arrives.
+        """
         # Get the server port
         port = self.ui.portSpinBox.value()
         limit = self.ui.trainLimitSpinBox.value()
@@ -835,121 +1527,236 @@ class MainWindowController(QMainWindow):
             self.log_message("Cannot fetch train data: Server is not running", "WARNING")
             return
         
+        # Skip this refresh if the previous one has not answered yet
+        if self._fetch_in_flight:
+            return
+        
+        if not self._take_request_token():
+            return
+        
+        # Build query parameters
+        params = {'limit': limit}
+        if route_filter:
+            params['route'] = route_filter
+        if origin_filter:
+            params['origin_station'] = origin_filter
+        if dest_filter:
+            params['destination_station'] = dest_filter
+        
+        # Remember the filters for the status label
+        filters_text = []
+        if route_filter:
+            filters_text.append(f"route={route_filter}")
+        if origin_filter:
+            filters_text.append(f"origin={origin_filter}")
+        if dest_filter:
+            filters_text.append(f"dest={dest_filter}")
+        self._train_filters_str = f" ({', '.join(filters_text)})" if filters_text else ""
+        
+        # Fetch data from the API
+        url = f"http://localhost:{port}/trains"
+        worker = FetchWorker(self._http, url, params, "train data",
+                             etag=self._train_etag, digest=self._train_digest)
+        worker.signals.done.connect(self._apply_train_data)
+        worker.signals.not_modified.connect(self._on_train_data_unchanged)
+        worker.signals.elapsed.connect(self._note_train_latency)
+        worker.signals.failed.connect(self._on_train_fetch_failed)
+        
+        self._fetch_in_flight = True
+        QThreadPool.globalInstance().start(worker)
+    
+    def _apply_train_data(self, data, etag, digest):
+        """Show a train data response fetched by refresh_train_data"""
+        self._fetch_in_flight = False
+        
         try:
-            # Build query parameters
-            params = {'limit': limit}
-            if route_filter:
-                params['route'] = route_filter
-            if origin_filter:
-                params['origin_station'] = origin_filter
-            if dest_filter:
-                params['destination_station'] = dest_filter
-            
-            # Fetch data from the API
-            url = f"http://localhost:{port}/trains"
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
             # Update the table
             self.update_train_table(data['trains'])
             
             # Update status label with filter info
-            timestamp = data.get('timestamp', 'Unknown')
-            filters_text = []
-            if route_filter:
-                filters_text.append(f"route={route_filter}")
-            if origin_filter:
-                filters_text.append(f"origin={origin_filter}")
-            if dest_filter:
-                filters_text.append(f"dest={dest_filter}")
-            filters_str = f" ({', '.join(filters_text)})" if filters_text else ""
-            self.ui.dataStatusLabel.setText(f"Last updated: {timestamp}{filters_str}")
+            self._train_timestamp = data.get('timestamp', 'Unknown')
+            self.ui.dataStatusLabel.setText(f"Last updated: {self._train_timestamp}{self._train_filters_str}")
             
             self.log_message(f"Fetched {len(data['trains'])} trains", "INFO")
             
-        except requests.ConnectionError:
-            self.log_message("Cannot connect to server. Is it running?", "ERROR")
-        except requests.Timeout:
-            self.log_message("Request timed out while fetching train data", "ERROR")
+            # Only revalidate against a payload that is actually on screen
+            self._train_etag = etag or None
+            self._train_digest = digest
+            
+            # Compare only what moves between polls
+            data_hash = hash(tuple(
+                (t.get('trip_id'), t.get('eta'), t.get('status')) for t in data['trains']
+            ))
+            changed = data_hash != self._train_data_hash
+            self._train_data_hash = data_hash
+            
         except Exception as e:
+            self._train_etag = None
+            self._train_digest = None
             self.log_message(f"Failed to fetch train data: {str(e)}", "ERROR")
+            changed = None
+        
+        self._schedule_auto_refresh(changed)
+    
+    def _on_train_data_unchanged(self):
+        """Note a refresh that found the train data unchanged"""
+        self._fetch_in_flight = False
+        checked = datetime.now().strftime("%H:%M:%S")
+        self.ui.dataStatusLabel.setText(
+            f"Last updated: {self._train_timestamp}{self._train_filters_str} (unchanged at {checked})"
+        )
+        self._schedule_auto_refresh(False)
+    
+    def _note_train_latency(self, seconds):
+        """Remember how long the server took to answer the last train request"""
+        self._train_latency_ms = int(seconds * 1000)
+    
+    def _on_train_fetch_failed(self, status, message):
+        """Log a failed train data request"""
+        self._fetch_in_flight = False
+        self.log_message(message, "ERROR")
+        self._schedule_auto_refresh()
     
     def update_train_table(self, trains):
-        """Update the train data table with fresh data"""
-        table = self.ui.trainTableWidget
-        
-        # Clear existing data
-        table.setRowCount(0)
-        
-        # Add new data
-        for train in trains:
-            row = table.rowCount()
-            table.insertRow(row)
-            
-            # Trip ID - show headsign if available for better context
-            trip_id = train.get('trip_id', 'N/A')
-            trip_headsign = train.get('trip_headsign')
-            if trip_headsign:
-                trip_display = f"{trip_headsign} ({trip_id})"
-            else:
-                trip_display = trip_id
-            table.setItem(row, 0, QTableWidgetItem(trip_display))
-            
-            # Route - show route name if available, otherwise route ID
-            route_display = train.get('route_name') if train.get('route_name') is not None else train.get('route_id', 'N/A')
-            table.setItem(row, 1, QTableWidgetItem(route_display))
-            
-            # Current Stop - show stop name if available, otherwise stop ID
-            current_stop_display = train.get('current_stop_name') if train.get('current_stop_name') is not None else train.get('current_stop', 'N/A')
-            table.setItem(row, 2, QTableWidgetItem(current_stop_display))
-            
-            # Next Stop - show stop name if available, otherwise stop ID
-            next_stop_display = train.get('next_stop_name') if train.get('next_stop_name') is not None else train.get('next_stop', 'N/A')
-            table.setItem(row, 3, QTableWidgetItem(next_stop_display))
-            
-            # ETA
-            eta = train.get('eta', 'N/A')
-            if eta and eta != 'N/A':
-                # Format the datetime nicely
-                try:
-                    dt = datetime.fromisoformat(eta.replace('Z', '+00:00'))
-                    eta = dt.strftime('%H:%M:%S')
-                except (ValueError, AttributeError):
-                    # Keep original value if parsing fails
-                    pass
-            table.setItem(row, 4, QTableWidgetItem(str(eta)))
-            
-            # Track
-            table.setItem(row, 5, QTableWidgetItem(train.get('track', 'N/A')))
-            
-            # Status
-            status = train.get('status', 'N/A')
-            status_item = QTableWidgetItem(str(status))
-            
-            # Color code by status
-            if status and 'On Time' in str(status):
-                status_item.setBackground(QColor(200, 255, 200))  # Light green
-            elif status and 'Delay' in str(status):
-                status_item.setBackground(QColor(255, 200, 200))  # Light red
-            
-            table.setItem(row, 6, status_item)
-        
-        # Resize columns to content
-        table.resizeColumnsToContents()
+        """Update the train data table with fresh data
+        
+        Rows are matched to the previous refresh by trip_id; when the same
+        trains are reported only the rows whose text changed are redrawn.
+        Every train gets a row, including trains without a trip_id.
+        """
+        self._train_model.update_rows([
+            (train.get('trip_id'), self._train_row_values(train))
+            for train in trains
+        ])
+    
+    def _train_row_values(self, train):
+        """Build the display text for each train table column"""
+        get = train.get
+        
+        # Trip ID - show headsign if available for better context
+        trip_id = get('trip_id', 'N/A')
+        trip_headsign = get('trip_headsign')
+        if trip_headsign:
+            trip_display = f"{trip_headsign} ({trip_id})"
+        else:
+            trip_display = trip_id
+        
+        # Route - show route name if available, otherwise route ID
+        route_display = get('route_name')
+        if route_display is None:
+            route_display = get('route_id', 'N/A')
+        
+        # Current Stop - show stop name if available, otherwise stop ID
+        current_stop_display = get('current_stop_name')
+        if current_stop_display is None:
+            current_stop_display = get('current_stop', 'N/A')
+        
+        # Next Stop - show stop name if available, otherwise stop ID
+        next_stop_display = get('next_stop_name')
+        if next_stop_display is None:
+            next_stop_display = get('next_stop', 'N/A')
+        
+        # ETA
+        eta = get('eta', 'N/A')
+        if isinstance(eta, str) and eta != 'N/A':
+            # Format the datetime nicely
+            eta = _format_eta(eta)
+        
+        return (
+            str(trip_display),
+            str(route_display),
+            str(current_stop_display),
+            str(next_stop_display),
+            str(eta),
+            str(get('track', 'N/A')),
+            str(get('status', 'N/A')),
+        )
     
     def toggle_auto_refresh(self, checked):
         """Toggle auto-refresh of train data"""
         if checked:
-            self.auto_refresh_timer.start(30000)  # 30 seconds
-            self.log_message("Auto-refresh enabled (30s interval)", "INFO")
-            # Do an initial refresh
-            self.refresh_train_data()
+            self._refresh_interval_ms = self.AUTO_REFRESH_START_MS
+            self.log_message(
+                f"Auto-refresh enabled ({self.AUTO_REFRESH_MIN_MS // 1000}-"
+                f"{self.AUTO_REFRESH_MAX_MS // 1000}s adaptive interval)", "INFO"
+            )
+            # Do an initial refresh; the next one is scheduled when it completes
+            self._auto_refresh_tick()
         else:
             self.auto_refresh_timer.stop()
             self.log_message("Auto-refresh disabled", "INFO")
     
+    def _auto_refresh_tick(self):
+        """Run one auto-refresh of the train data"""
+        self.refresh_train_data()
+        if not self._fetch_in_flight:
+            # Nothing was sent (e.g. the server is not running), try again later
+            self._schedule_auto_refresh()
+    
+    def _schedule_auto_refresh(self, changed=None):
+        """Arm the next auto-refresh, adapting the interval to how often data changes
+        
+        The interval never drops below a floor that grows with the latency of
+        the last train request, so a slow server is polled less often.
+        
+        Args:
+            changed: True if the last refresh brought new data, False if it
+                was unchanged, None to keep the current interval
+        """
+        if not self.ui.autoRefreshCheckBox.isChecked():
+            return
+        
+        if changed is True:
+            self._refresh_interval_ms //= 2
+        elif changed is False:
+            self._refresh_interval_ms *= 2
+        
+        floor_ms = min(self.AUTO_REFRESH_MAX_MS,
+                       self.AUTO_REFRESH_MIN_MS + self.AUTO_REFRESH_LATENCY_FACTOR * self._train_latency_ms)
+        self._refresh_interval_ms = max(floor_ms, min(self.AUTO_REFRESH_MAX_MS, self._refresh_interval_ms))
+        
+        self.auto_refresh_timer.start(self._refresh_interval_ms)
+    
+    def _is_fresh(self, fetched_at):
+        """Return True if data fetched at the given monotonic time is within STATIC_DATA_TTL"""
+        return fetched_at is not None and time.monotonic() - fetched_at < self.STATIC_DATA_TTL
+    
+    def _start_fetch(self, url, params, description, status_label, on_done):
+        """Fetch an API endpoint on the thread pool
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters, or None
+            description: What is fetched, for error messages
+            status_label: Label showing progress and the reason for a failure
+            on_done: Controller slot receiving (data, etag, digest)
+        """
+        worker = FetchWorker(self._http, url, params, description)
+        worker.signals.done.connect(on_done)
+        # setText takes only the short status, the first signal argument
+        worker.signals.failed.connect(status_label.setText)
+        worker.signals.failed.connect(self._log_fetch_error)
+        status_label.setText("Loading...")
+        QThreadPool.globalInstance().start(worker)
+    
+    def _take_request_token(self, status_label=None):
+        """Return True if a refresh may send its request under the client-side rate limit
+        
+        Args:
+            status_label: Label told about a skipped refresh, or None
+        """
+        if self._request_bucket.try_acquire():
+            return True
+        wait = self._request_bucket.wait_time()
+        self.log_message(f"Rate limited client-side, skipping refresh (retry in {wait:.1f}s)", "DEBUG")
+        if status_label is not None:
+            status_label.setText("Too many refreshes, try again shortly")
+        return False
+    
+    def _log_fetch_error(self, status, message):
+        """Log the error of a failed refresh"""
+        self.log_message(message, "ERROR")
+    
     def refresh_stations_data(self):
         """Refresh stations data from the API"""
         port = self.ui.portSpinBox.value()
@@ -960,39 +1767,43 @@ class MainWindowController(QMainWindow):
             self.stationsStatusLabel.setText("Server is not running")
             return
         
+        if self._is_fresh(self._stations_fetched_at):
+            self.log_message("Stations data is up to date", "INFO")
+            return
+        
+        if not self._take_request_token(self.stationsStatusLabel):
+            return
+        
+        # Fetch data from the API
+        url = f"http://localhost:{port}/stations"
+        self._start_fetch(url, None, "stations data", self.stationsStatusLabel, self._show_stations_data)
+    
+    def _show_stations_data(self, data, etag, digest):
+        """Fill the stations table from a /stations response"""
         try:
-            # Fetch data from the API
-            url = f"http://localhost:{port}/stations"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
             stations = data.get('stations', [])
+            self._stations_fetched_at = time.monotonic()
             
-            # Update the table
-            self.stationsTable.setRowCount(0)
-            for station in stations:
-                row = self.stationsTable.rowCount()
-                self.stationsTable.insertRow(row)
-                
-                self.stationsTable.setItem(row, 0, QTableWidgetItem(station.get('stop_id', 'N/A')))
-                self.stationsTable.setItem(row, 1, QTableWidgetItem(station.get('stop_name', 'N/A')))
-                self.stationsTable.setItem(row, 2, QTableWidgetItem(station.get('stop_code', 'N/A')))
-                self.stationsTable.setItem(row, 3, QTableWidgetItem(station.get('stop_lat', 'N/A')))
-                self.stationsTable.setItem(row, 4, QTableWidgetItem(station.get('stop_lon', 'N/A')))
-                self.stationsTable.setItem(row, 5, QTableWidgetItem(station.get('wheelchair_boarding', 'N/A')))
+            # Update the table, unless it already shows these stations
+            if stations != self._stations_shown:
+                self._bulk_fill(self.stationsTable, [
+                    (
+                        station.get('stop_id', 'N/A'),
+                        station.get('stop_name', 'N/A'),
+                        station.get('stop_code', 'N/A'),
+                        station.get('stop_lat', 'N/A'),
+                        station.get('stop_lon', 'N/A'),
+                        station.get('wheelchair_boarding', 'N/A'),
+                    )
+                    for station in stations
+                ])
+                self._stations_shown = stations
             
             # Update status label
             timestamp = data.get('timestamp', 'Unknown')
             self.stationsStatusLabel.setText(f"Last updated: {timestamp} - Total: {len(stations)} stations")
             self.log_message(f"Fetched {len(stations)} stations", "INFO")
             
-        except requests.ConnectionError:
-            self.log_message("Cannot connect to server. Is it running?", "ERROR")
-            self.stationsStatusLabel.setText("Connection error")
-        except requests.Timeout:
-            self.log_message("Request timed out while fetching stations data", "ERROR")
-            self.stationsStatusLabel.setText("Request timed out")
         except Exception as e:
             self.log_message(f"Failed to fetch stations data: {str(e)}", "ERROR")
             self.stationsStatusLabel.setText("Error fetching data")
@@ -1007,55 +1818,60 @@ class MainWindowController(QMainWindow):
             self.routesStatusLabel.setText("Server is not running")
             return
         
+        if self._is_fresh(self._routes_fetched_at):
+            self.log_message("Routes data is up to date", "INFO")
+            return
+        
+        if not self._take_request_token(self.routesStatusLabel):
+            return
+        
+        # Fetch data from the API
+        url = f"http://localhost:{port}/routes"
+        self._start_fetch(url, None, "routes data", self.routesStatusLabel, self._show_routes_data)
+    
+    def _show_routes_data(self, data, etag, digest):
+        """Fill the routes table from a /routes response"""
         try:
-            # Fetch data from the API
-            url = f"http://localhost:{port}/routes"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
             routes = data.get('routes', [])
+            self._routes_fetched_at = time.monotonic()
             
-            # Update the table
-            self.routesTable.setRowCount(0)
-            for route in routes:
-                row = self.routesTable.rowCount()
-                self.routesTable.insertRow(row)
-                
-                self.routesTable.setItem(row, 0, QTableWidgetItem(route.get('route_id', 'N/A')))
-                route_name = route.get('route_long_name', route.get('route_short_name', 'N/A'))
-                self.routesTable.setItem(row, 1, QTableWidgetItem(route_name))
-                self.routesTable.setItem(row, 2, QTableWidgetItem(route.get('route_short_name', 'N/A')))
-                
-                # Color display with background
-                color_hex = route.get('route_color', 'FFFFFF')
-                color_item = QTableWidgetItem(f"#{color_hex}")
-                try:
-                    color_item.setBackground(QColor(f"#{color_hex}"))
-                except:
-                    pass
-                self.routesTable.setItem(row, 3, color_item)
-                
-                # Text color
-                text_color_hex = route.get('route_text_color', '000000')
-                text_color_item = QTableWidgetItem(f"#{text_color_hex}")
-                try:
-                    text_color_item.setBackground(QColor(f"#{text_color_hex}"))
-                except:
-                    pass
-                self.routesTable.setItem(row, 4, text_color_item)
+            # Update the table, unless it already shows these routes
+            if routes != self._routes_shown:
+                rows = []
+                for route in routes:
+                    route_name = route.get('route_long_name', route.get('route_short_name', 'N/A'))
+                    
+                    # Color display with background
+                    color_hex = route.get('route_color', 'FFFFFF')
+                    color_item = QTableWidgetItem(f"#{color_hex}")
+                    try:
+                        color_item.setBackground(QColor(f"#{color_hex}"))
+                    except:
+                        pass
+                    
+                    # Text color
+                    text_color_hex = route.get('route_text_color', '000000')
+                    text_color_item = QTableWidgetItem(f"#{text_color_hex}")
+                    try:
+                        text_color_item.setBackground(QColor(f"#{text_color_hex}"))
+                    except:
+                        pass
+                    
+                    rows.append((
+                        route.get('route_id', 'N/A'),
+                        route_name,
+                        route.get('route_short_name', 'N/A'),
+                        color_item,
+                        text_color_item,
+                    ))
+                self._bulk_fill(self.routesTable, rows)
+                self._routes_shown = routes
             
             # Update status label
             timestamp = data.get('timestamp', 'Unknown')
             self.routesStatusLabel.setText(f"Last updated: {timestamp} - Total: {len(routes)} routes")
             self.log_message(f"Fetched {len(routes)} routes", "INFO")
             
-        except requests.ConnectionError:
-            self.log_message("Cannot connect to server. Is it running?", "ERROR")
-            self.routesStatusLabel.setText("Connection error")
-        except requests.Timeout:
-            self.log_message("Request timed out while fetching routes data", "ERROR")
-            self.routesStatusLabel.setText("Request timed out")
         except Exception as e:
             self.log_message(f"Failed to fetch routes data: {str(e)}", "ERROR")
             self.routesStatusLabel.setText("Error fetching data")
@@ -1070,89 +1886,57 @@ class MainWindowController(QMainWindow):
             self.travelStatusLabel.setText("Server is not running")
             return
         
-        try:
-            # Fetch location data
-            try:
-                url = f"http://localhost:{port}/travel/location"
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    location_text = json.dumps(data, indent=2)
-                    self.locationText.setPlainText(location_text)
-                elif response.status_code == 503:
-                    data = response.json()
-                    self.locationText.setPlainText(f"Not configured: {data.get('error', 'Unknown error')}")
-                else:
-                    self.locationText.setPlainText(f"Error: HTTP {response.status_code}")
-            except Exception as e:
-                self.locationText.setPlainText(f"Error: {str(e)}")
-            
-            # Fetch distance data
-            try:
-                url = f"http://localhost:{port}/travel/distance"
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    distance_text = json.dumps(data, indent=2)
-                    self.distanceText.setPlainText(distance_text)
-                elif response.status_code == 503:
-                    data = response.json()
-                    self.distanceText.setPlainText(f"Not configured: {data.get('error', 'Unknown error')}")
-                else:
-                    self.distanceText.setPlainText(f"Error: HTTP {response.status_code}")
-            except Exception as e:
-                self.distanceText.setPlainText(f"Error: {str(e)}")
-            
-            # Fetch next train data
-            try:
-                # Build query parameters
-                params = {}
-                if hasattr(self, 'travelDestEdit'):
-                    dest_filter = self.travelDestEdit.text().strip()
-                    if dest_filter:
-                        params['destination'] = dest_filter
-                if hasattr(self, 'travelRouteEdit'):
-                    route_filter = self.travelRouteEdit.text().strip()
-                    if route_filter:
-                        params['route'] = route_filter
-                
-                url = f"http://localhost:{port}/travel/next-train"
-                response = requests.get(url, params=params, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    next_train_text = json.dumps(data, indent=2)
-                    self.nextTrainText.setPlainText(next_train_text)
-                elif response.status_code == 503:
-                    data = response.json()
-                    self.nextTrainText.setPlainText(f"Not configured: {data.get('error', 'Unknown error')}")
-                else:
-                    self.nextTrainText.setPlainText(f"Error: HTTP {response.status_code}")
-            except Exception as e:
-                self.nextTrainText.setPlainText(f"Error: {str(e)}")
-            
-            # Fetch Arduino device data
-            try:
-                url = f"http://localhost:{port}/travel/arduino-device"
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    arduino_text = json.dumps(data, indent=2)
-                    self.arduinoText.setPlainText(arduino_text)
-                elif response.status_code == 503:
-                    data = response.json()
-                    self.arduinoText.setPlainText(f"Not configured: {data.get('error', 'Unknown error')}")
-                else:
-                    self.arduinoText.setPlainText(f"Error: HTTP {response.status_code}")
-            except Exception as e:
-                self.arduinoText.setPlainText(f"Error: {str(e)}")
-            
-            # Update status label
-            self.travelStatusLabel.setText(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            self.log_message("Fetched travel assistance data", "INFO")
-            
-        except Exception as e:
-            self.log_message(f"Failed to fetch travel data: {str(e)}", "ERROR")
-            self.travelStatusLabel.setText("Error fetching data")
+        if self._travel_pending:
+            # The previous refresh is still running
+            return
+        
+        # One token covers the four travel requests
+        if not self._take_request_token(self.travelStatusLabel):
+            return
+        
+        # Build query parameters for the next train recommendation
+        params = {}
+        dest_filter = self.travelDestEdit.text().strip()
+        if dest_filter:
+            params['destination'] = dest_filter
+        route_filter = self.travelRouteEdit.text().strip()
+        if route_filter:
+            params['route'] = route_filter
+        
+        # Fetch all four endpoints at once; each fills its own text box
+        endpoints = (
+            (f"http://localhost:{port}/travel/location", None, self.locationText),
+            (f"http://localhost:{port}/travel/distance", None, self.distanceText),
+            (f"http://localhost:{port}/travel/next-train", params, self.nextTrainText),
+            (f"http://localhost:{port}/travel/arduino-device", None, self.arduinoText),
+        )
+        pool = QThreadPool.globalInstance()
+        self._travel_pending = len(endpoints)
+        self._travel_views = {url: text_edit for url, _, text_edit in endpoints}
+        self.travelStatusLabel.setText("Loading...")
+        for url, url_params, text_edit in endpoints:
+            worker = TravelFetchWorker(self._http, url, url_params)
+            worker.signals.done.connect(self._on_travel_part_done)
+            pool.start(worker)
+    
+    def _on_travel_part_done(self, url, text):
+        """Show one travel endpoint's text and update the status once all have answered
+        
+        The text is only laid out if the Travel tab is the current tab;
+        otherwise it is kept until the tab is opened.
+        """
+        text_edit = self._travel_views[url]
+        if self.ui.tabWidget.currentWidget() is self.travelTab:
+            self._hidden_travel_texts.pop(text_edit, None)
+            text_edit.setPlainText(text)
+        else:
+            self._hidden_travel_texts[text_edit] = text
+        
+        self._travel_pending -= 1
+        if self._travel_pending:
+            return
+        self.travelStatusLabel.setText(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self.log_message("Fetched travel assistance data", "INFO")
     
     def refresh_api_info(self):
         """Refresh API information from the root endpoint"""
@@ -1164,28 +1948,28 @@ class MainWindowController(QMainWindow):
             self.apiInfoStatusLabel.setText("Server is not running")
             return
         
+        if not self._take_request_token(self.apiInfoStatusLabel):
+            return
+        
+        # Fetch data from the API
+        url = f"http://localhost:{port}/"
+        self._start_fetch(url, None, "API info", self.apiInfoStatusLabel, self._show_api_info)
+    
+    def _show_api_info(self, data, etag, digest):
+        """Show the root endpoint's API description"""
         try:
-            # Fetch data from the API
-            url = f"http://localhost:{port}/"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Format the data nicely
-            api_info_text = json.dumps(data, indent=2)
-            self.apiInfoText.setPlainText(api_info_text)
+            if self.ui.tabWidget.currentWidget() is self.apiInfoTab:
+                # Format the data nicely
+                self._hidden_api_info = None
+                self.apiInfoText.setPlainText(_pretty_json(data))
+            else:
+                # Formatted when the tab is opened
+                self._hidden_api_info = data
             
             # Update status label
             self.apiInfoStatusLabel.setText(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             self.log_message("Fetched API information", "INFO")
             
-        except requests.ConnectionError:
-            self.log_message("Cannot connect to server. Is it running?", "ERROR")
-            self.apiInfoStatusLabel.setText("Connection error")
-        except requests.Timeout:
-            self.log_message("Request timed out while fetching API info", "ERROR")
-            self.apiInfoStatusLabel.setText("Request timed out")
         except Exception as e:
             self.log_message(f"Failed to fetch API info: {str(e)}", "ERROR")
             self.apiInfoStatusLabel.setText("Error fetching data")
@@ -1203,88 +1987,64 @@ class MainWindowController(QMainWindow):
             self.vehiclePositionsStatusLabel.setText("Server is not running")
             return
         
+        if not self._take_request_token(self.vehiclePositionsStatusLabel):
+            return
+        
+        # Build query parameters
+        params = {'limit': limit}
+        if route_filter:
+            params['route'] = route_filter
+        if trip_id_filter:
+            params['trip_id'] = trip_id_filter
+        
+        # Remember the filters for the status label
+        filters_text = []
+        if route_filter:
+            filters_text.append(f"route={route_filter}")
+        if trip_id_filter:
+            filters_text.append(f"trip_id={trip_id_filter}")
+        self._vehicle_filters_str = f" ({', '.join(filters_text)})" if filters_text else ""
+        
+        # Fetch data from the API
+        url = f"http://localhost:{port}/vehicle-positions"
+        self._start_fetch(url, params, "vehicle positions", self.vehiclePositionsStatusLabel,
+                          self._show_vehicle_positions)
+    
+    def _show_vehicle_positions(self, data, etag, digest):
+        """Show a /vehicle-positions response in the vehicle positions table"""
         try:
-            # Build query parameters
-            params = {'limit': limit}
-            if route_filter:
-                params['route'] = route_filter
-            if trip_id_filter:
-                params['trip_id'] = trip_id_filter
-            
-            # Fetch data from the API
-            url = f"http://localhost:{port}/vehicle-positions"
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
             vehicles = data.get('vehicles', [])
             
-            # Clear existing data
-            self.vehiclePositionsTable.setRowCount(0)
-            
-            # Add new data
-            for vehicle in vehicles:
-                row = self.vehiclePositionsTable.rowCount()
-                self.vehiclePositionsTable.insertRow(row)
-                
-                # Vehicle ID
-                vehicle_id = vehicle.get('vehicle_id', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 0, QTableWidgetItem(str(vehicle_id)))
-                
-                # Trip ID
-                trip_id = vehicle.get('trip_id', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 1, QTableWidgetItem(str(trip_id)))
-                
-                # Route - show route name if available
-                route_display = vehicle.get('route_name') if vehicle.get('route_name') else vehicle.get('route_id', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 2, QTableWidgetItem(str(route_display)))
-                
-                # Latitude
-                latitude = vehicle.get('latitude', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 3, QTableWidgetItem(str(latitude)))
-                
-                # Longitude
-                longitude = vehicle.get('longitude', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 4, QTableWidgetItem(str(longitude)))
-                
-                # Bearing
-                bearing = vehicle.get('bearing', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 5, QTableWidgetItem(str(bearing)))
-                
-                # Speed
-                speed = vehicle.get('speed', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 6, QTableWidgetItem(str(speed)))
-                
-                # Stop ID - show stop name if available
-                stop_display = vehicle.get('stop_name') if vehicle.get('stop_name') else vehicle.get('stop_id', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 7, QTableWidgetItem(str(stop_display)))
-                
-                # Status
-                status = vehicle.get('current_status', 'N/A')
-                self.vehiclePositionsTable.setItem(row, 8, QTableWidgetItem(str(status)))
+            # Replace the model rows; the view renders them on demand
+            previous_count = self.vehiclePositionsModel.rowCount()
+            self.vehiclePositionsModel.set_rows([
+                (
+                    str(vehicle.get('vehicle_id', 'N/A')),
+                    str(vehicle.get('trip_id', 'N/A')),
+                    # Route - show route name if available
+                    str(vehicle.get('route_name') or vehicle.get('route_id', 'N/A')),
+                    str(vehicle.get('latitude', 'N/A')),
+                    str(vehicle.get('longitude', 'N/A')),
+                    str(vehicle.get('bearing', 'N/A')),
+                    str(vehicle.get('speed', 'N/A')),
+                    # Stop ID - show stop name if available
+                    str(vehicle.get('stop_name') or vehicle.get('stop_id', 'N/A')),
+                    str(vehicle.get('current_status', 'N/A')),
+                )
+                for vehicle in vehicles
+            ])
             
-            # Resize columns to content
-            self.vehiclePositionsTable.resizeColumnsToContents()
+            # Resize columns to content when the table grew or shrank
+            if self.vehiclePositionsModel.rowCount() != previous_count:
+                self.vehiclePositionsTable.resizeColumnsToContents()
             
             # Update status label
             timestamp = data.get('timestamp', 'Unknown')
-            filters_text = []
-            if route_filter:
-                filters_text.append(f"route={route_filter}")
-            if trip_id_filter:
-                filters_text.append(f"trip_id={trip_id_filter}")
-            filters_str = f" ({', '.join(filters_text)})" if filters_text else ""
             self.vehiclePositionsStatusLabel.setText(
-                f"Last updated: {timestamp} - Total: {len(vehicles)} vehicles{filters_str}"
+                f"Last updated: {timestamp} - Total: {len(vehicles)} vehicles{self._vehicle_filters_str}"
             )
             self.log_message(f"Fetched {len(vehicles)} vehicle positions", "INFO")
             
-        except requests.ConnectionError:
-            self.log_message("Cannot connect to server. Is it running?", "ERROR")
-            self.vehiclePositionsStatusLabel.setText("Connection error")
-        except requests.Timeout:
-            self.log_message("Request timed out while fetching vehicle positions", "ERROR")
-            self.vehiclePositionsStatusLabel.setText("Request timed out")
         except Exception as e:
             self.log_message(f"Failed to fetch vehicle positions: {str(e)}", "ERROR")
             self.vehiclePositionsStatusLabel.setText("Error fetching data")
@@ -1301,93 +2061,91 @@ class MainWindowController(QMainWindow):
             self.alertsStatusLabel.setText("Server is not running")
             return
         
+        if not self._take_request_token(self.alertsStatusLabel):
+            return
+        
+        # Build query parameters
+        params = {}
+        if route_filter:
+            params['route'] = route_filter
+        if stop_filter:
+            params['stop'] = stop_filter
+        
+        # Remember the filters for the status label
+        filters_text = []
+        if route_filter:
+            filters_text.append(f"route={route_filter}")
+        if stop_filter:
+            filters_text.append(f"stop={stop_filter}")
+        self._alert_filters_str = f" ({', '.join(filters_text)})" if filters_text else ""
+        
+        # Fetch data from the API
+        url = f"http://localhost:{port}/alerts"
+        self._start_fetch(url, params, "alerts", self.alertsStatusLabel, self._show_alerts_data)
+    
+    def _show_alerts_data(self, data, etag, digest):
+        """Fill the alerts table from an /alerts response"""
         try:
-            # Build query parameters
-            params = {}
-            if route_filter:
-                params['route'] = route_filter
-            if stop_filter:
-                params['stop'] = stop_filter
-            
-            # Fetch data from the API
-            url = f"http://localhost:{port}/alerts"
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
             alerts = data.get('alerts', [])
             
-            # Clear existing data
-            self.alertsTable.setRowCount(0)
-            
-            # Add new data
+            # Build the rows, then replace the table contents in one pass
+            effect_brushes = _EFFECT_BRUSHES
+            desc_chars = self.ALERT_DESCRIPTION_CELL_CHARS
+            rows = []
             for alert in alerts:
-                row = self.alertsTable.rowCount()
-                self.alertsTable.insertRow(row)
-                
                 # Alert ID
                 alert_id = alert.get('alert_id', 'N/A')
-                self.alertsTable.setItem(row, 0, QTableWidgetItem(str(alert_id)))
                 
                 # Header text
                 header_text = alert.get('header_text', 'N/A')
-                self.alertsTable.setItem(row, 1, QTableWidgetItem(str(header_text)))
                 
                 # Description text
-                description_text = alert.get('description_text', 'N/A')
-                desc_item = QTableWidgetItem(str(description_text))
-                desc_item.setToolTip(str(description_text))  # Show full text on hover
-                self.alertsTable.setItem(row, 2, desc_item)
+                # Long descriptions are cut in the cell so the table holds
+                # one full copy of the text (the tooltip) rather than two
+                description_text = str(alert.get('description_text', 'N/A'))
+                if len(description_text) > desc_chars:
+                    desc_item = QTableWidgetItem(description_text[:desc_chars].rstrip() + '…')
+                else:
+                    desc_item = QTableWidgetItem(description_text)
+                desc_item.setToolTip(description_text)  # Show full text on hover
                 
                 # Effect
                 effect = alert.get('effect', 'N/A')
                 effect_item = QTableWidgetItem(str(effect))
                 # Color code by effect
-                if effect in ['SIGNIFICANT_DELAYS', 'REDUCED_SERVICE']:
-                    effect_item.setBackground(QColor(255, 200, 200))  # Light red
-                elif effect == 'DETOUR':
-                    effect_item.setBackground(QColor(255, 255, 200))  # Light yellow
-                elif effect == 'MODIFIED_SERVICE':
-                    effect_item.setBackground(QColor(200, 220, 255))  # Light blue
-                self.alertsTable.setItem(row, 3, effect_item)
+                effect_brush = effect_brushes.get(effect)
+                if effect_brush is not None:
+                    effect_item.setBackground(effect_brush)
                 
                 # Informed entities (routes/stops affected)
                 informed_entities = alert.get('informed_entities', [])
                 entities_text = []
                 for entity in informed_entities:
-                    if entity.get('route_id'):
-                        route_name = entity.get('route_name', entity.get('route_id'))
+                    route_id = entity.get('route_id')
+                    if route_id:
+                        route_name = entity.get('route_name', route_id)
                         entities_text.append(f"Route: {route_name}")
-                    if entity.get('stop_id'):
-                        stop_name = entity.get('stop_name', entity.get('stop_id'))
+                    stop_id = entity.get('stop_id')
+                    if stop_id:
+                        stop_name = entity.get('stop_name', stop_id)
                         entities_text.append(f"Stop: {stop_name}")
                 entities_str = '; '.join(entities_text) if entities_text else 'N/A'
                 entities_item = QTableWidgetItem(entities_str)
                 entities_item.setToolTip(entities_str)  # Show full text on hover
-                self.alertsTable.setItem(row, 4, entities_item)
+                
+                rows.append((str(alert_id), str(header_text), desc_item, effect_item, entities_item))
             
-            # Resize columns to content
-            self.alertsTable.resizeColumnsToContents()
+            # Resize columns to content when the table grew or shrank
+            if self._bulk_fill(self.alertsTable, rows):
+                self.alertsTable.resizeColumnsToContents()
             
             # Update status label
             timestamp = data.get('timestamp', 'Unknown')
-            filters_text = []
-            if route_filter:
-                filters_text.append(f"route={route_filter}")
-            if stop_filter:
-                filters_text.append(f"stop={stop_filter}")
-            filters_str = f" ({', '.join(filters_text)})" if filters_text else ""
             self.alertsStatusLabel.setText(
-                f"Last updated: {timestamp} - Total: {len(alerts)} alerts{filters_str}"
+                f"Last updated: {timestamp} - Total: {len(alerts)} alerts{self._alert_filters_str}"
             )
             self.log_message(f"Fetched {len(alerts)} alerts", "INFO")
             
-        except requests.ConnectionError:
-            self.log_message("Cannot connect to server. Is it running?", "ERROR")
-            self.alertsStatusLabel.setText("Connection error")
-        except requests.Timeout:
-            self.log_message("Request timed out while fetching alerts", "ERROR")
-            self.alertsStatusLabel.setText("Request timed out")
         except Exception as e:
             self.log_message(f"Failed to fetch alerts: {str(e)}", "ERROR")
             self.alertsStatusLabel.setText("Error fetching data")
@@ -1425,7 +2183,10 @@ class MainWindowController(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                self.stop_server()
+                # The window is going away, so wait for the process here
+                self._stop_requested = True
+                self.server_thread.stop(wait=True)
+                self.server_thread.wait()
                 event.accept()
             else:
                 event.ignore()
@@ -0,0 +1,53 @@
+"""
+Read-only table model backed by a list of row tuples
+"""
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class JsonTableModel(QAbstractTableModel):
+    """Table model that serves rows of display strings to a QTableView
+    
+    Rows are held by reference and rendered on demand, so replacing the
+    data does not allocate one item object per cell the way QTableWidget
+    does.
+    """
+    
+    def __init__(self, headers, parent=None):
+        """Initialize the model
+        
+        Args:
+            headers: Column header labels
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._rows = []
+    
+    def set_rows(self, rows):
+        """Replace every row of the model
+        
+        Args:
+            rows: List of tuples with one display string per column
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
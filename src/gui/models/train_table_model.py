@@ -0,0 +1,83 @@
+"""
+Table model for the live train data view
+"""
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor
+
+from src.gui.models.json_table_model import JsonTableModel
+
+
+TRAIN_HEADERS = ("Trip ID", "Route", "Current Stop", "Next Stop", "ETA", "Track", "Status")
+STATUS_COLUMN = 6
+
+# Status cell backgrounds, shared by every row
+_ON_TIME_BRUSH = QBrush(QColor(200, 255, 200))  # Light green
+_DELAY_BRUSH = QBrush(QColor(255, 200, 200))    # Light red
+
+
+def _status_brush(status):
+    """Return the background brush for a status, or None for no colour"""
+    if 'On Time' in status:
+        return _ON_TIME_BRUSH
+    if 'Delay' in status:
+        return _DELAY_BRUSH
+    return None
+
+
+class TrainTableModel(JsonTableModel):
+    """Train rows, each tagged with its trip_id
+    
+    A refresh that reports the same trains only signals the rows whose text
+    changed, so the view keeps its selection, scroll position and sort
+    order; the model is only reset when trains arrive or depart. Trains
+    without a trip_id, or sharing one, each keep their own row, but any
+    refresh that contains them resets the model.
+    """
+    
+    def __init__(self, parent=None):
+        """Initialize the model
+        
+        Args:
+            parent: Optional parent QObject
+        """
+        super().__init__(TRAIN_HEADERS, parent)
+        self._keys = []
+        self._brushes = []
+    
+    def update_rows(self, rows):
+        """Show a new set of trains
+        
+        Args:
+            rows: List of (trip_id, values) pairs in display order, where
+                values is a tuple of display strings, one per column.
+                trip_id may be None or repeated.
+        """
+        keys = [key for key, _ in rows]
+        values_list = [values for _, values in rows]
+        
+        # Rows can only be matched one to one by unique, known trip_ids
+        matchable = None not in keys and len(set(keys)) == len(keys)
+        if not matchable or keys != self._keys:
+            self.beginResetModel()
+            self._keys = keys
+            self._rows = values_list
+            self._brushes = [_status_brush(values[STATUS_COLUMN]) for values in values_list]
+            self.endResetModel()
+            return
+        
+        last_column = len(TRAIN_HEADERS) - 1
+        for row, values in enumerate(values_list):
+            if values != self._rows[row]:
+                self._rows[row] = values
+                self._brushes[row] = _status_brush(values[STATUS_COLUMN])
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+    
+    def clear(self):
+        """Remove every row"""
+        self.update_rows([])
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.BackgroundRole and index.isValid() and index.column() == STATUS_COLUMN:
+            return self._brushes[index.row()]
+        return super().data(index, role)
@@ -19,10 +19,9 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QFormLayout,
     QGridLayout, QGroupBox, QHBoxLayout, QHeaderView,
     QLabel, QLineEdit, QMainWindow, QMenu,
-    QMenuBar, QProgressBar, QPushButton, QSizePolicy,
-    QSpacerItem, QSpinBox, QStatusBar, QTabWidget,
-    QTableWidget, QTableWidgetItem, QTextEdit, QVBoxLayout,
-    QWidget)
+    QMenuBar, QPlainTextEdit, QProgressBar, QPushButton,
+    QSizePolicy, QSpacerItem, QSpinBox, QStatusBar,
+    QTabWidget, QTableView, QVBoxLayout, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -228,9 +227,12 @@ class Ui_MainWindow(object):
 
         self.verticalLayout_3.addLayout(self.horizontalLayout_2)
 
-        self.logsTextEdit = QTextEdit(self.logsTab)
+        self.logsTextEdit = QPlainTextEdit(self.logsTab)
         self.logsTextEdit.setObjectName(u"logsTextEdit")
+        self.logsTextEdit.setUndoRedoEnabled(False)
+        self.logsTextEdit.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.logsTextEdit.setReadOnly(True)
+        self.logsTextEdit.setMaximumBlockCount(5000)
 
         self.verticalLayout_3.addWidget(self.logsTextEdit)
 
@@ -276,30 +278,14 @@ class Ui_MainWindow(object):
 
         self.verticalLayout_5.addWidget(self.dataStatusLabel)
 
-        self.trainTableWidget = QTableWidget(self.dataTab)
-        if (self.trainTableWidget.columnCount() < 7):
-            self.trainTableWidget.setColumnCount(7)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.trainTableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.trainTableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.trainTableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.trainTableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.trainTableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.trainTableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem5)
-        __qtablewidgetitem6 = QTableWidgetItem()
-        self.trainTableWidget.setHorizontalHeaderItem(6, __qtablewidgetitem6)
-        self.trainTableWidget.setObjectName(u"trainTableWidget")
-        self.trainTableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.trainTableWidget.setAlternatingRowColors(True)
-        self.trainTableWidget.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.trainTableWidget.setSortingEnabled(True)
-
-        self.verticalLayout_5.addWidget(self.trainTableWidget)
+        self.trainTableView = QTableView(self.dataTab)
+        self.trainTableView.setObjectName(u"trainTableView")
+        self.trainTableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.trainTableView.setAlternatingRowColors(True)
+        self.trainTableView.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.trainTableView.setSortingEnabled(True)
+
+        self.verticalLayout_5.addWidget(self.trainTableView)
 
         self.tabWidget.addTab(self.dataTab, "")
 
@@ -366,22 +352,8 @@ class Ui_MainWindow(object):
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.logsTab), QCoreApplication.translate("MainWindow", u"Logs & Errors", None))
         self.limitLabel.setText(QCoreApplication.translate("MainWindow", u"Train Limit:", None))
         self.refreshDataButton.setText(QCoreApplication.translate("MainWindow", u"Refresh Train Data", None))
-        self.autoRefreshCheckBox.setText(QCoreApplication.translate("MainWindow", u"Auto-refresh (30s)", None))
+        self.autoRefreshCheckBox.setText(QCoreApplication.translate("MainWindow", u"Auto-refresh (5-60s)", None))
         self.dataStatusLabel.setText(QCoreApplication.translate("MainWindow", u"Last updated: Never", None))
-        ___qtablewidgetitem = self.trainTableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"Trip ID", None));
-        ___qtablewidgetitem1 = self.trainTableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"Route", None));
-        ___qtablewidgetitem2 = self.trainTableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"Current Stop", None));
-        ___qtablewidgetitem3 = self.trainTableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"Next Stop", None));
-        ___qtablewidgetitem4 = self.trainTableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"ETA", None));
-        ___qtablewidgetitem5 = self.trainTableWidget.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("MainWindow", u"Track", None));
-        ___qtablewidgetitem6 = self.trainTableWidget.horizontalHeaderItem(6)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("MainWindow", u"Status", None));
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.dataTab), QCoreApplication.translate("MainWindow", u"Train Data Visualization", None))
         self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"File", None))
         self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"Help", None))
@@ -6,7 +6,9 @@ from the MTA Metro-North Railroad GTFS-RT API.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
 from src.gtfs_realtime.com.google.transit.realtime import gtfs_realtime_pb2
 from src.gtfs_realtime import mta_railroad_pb2
 
@@ -32,6 +34,11 @@ class MTAGTFSRealtimeClient:
         """
         self.api_key = api_key
         self.session = requests.Session()
+        # Keep connections to the feed host alive between polls
+        self.session.mount("https://", HTTPAdapter(
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        ))
         if api_key:
             self.session.headers.update({'x-api-key': api_key})
     
@@ -113,80 +120,97 @@ class MTAGTFSRealtimeClient:
         
         return alerts
     
-    def print_trip_update_details(self, trip_update):
+    def format_trip_update_details(self, trip_update) -> str:
         """
-        Print detailed information about a trip update including MTA Railroad extensions.
+        Format detailed information about a trip update including MTA Railroad extensions.
         
         Args:
             trip_update: TripUpdate entity to display
+            
+        Returns:
+            str: Multi-line description of the trip update
         """
-        print(f"\n=== Trip Update ===")
+        lines = [f"\n=== Trip Update ==="]
         
         if trip_update.HasField('trip'):
             trip = trip_update.trip
-            print(f"Trip ID: {trip.trip_id if trip.HasField('trip_id') else 'N/A'}")
-            print(f"Route ID: {trip.route_id if trip.HasField('route_id') else 'N/A'}")
-            print(f"Start Date: {trip.start_date if trip.HasField('start_date') else 'N/A'}")
+            lines.append(f"Trip ID: {trip.trip_id if trip.HasField('trip_id') else 'N/A'}")
+            lines.append(f"Route ID: {trip.route_id if trip.HasField('route_id') else 'N/A'}")
+            lines.append(f"Start Date: {trip.start_date if trip.HasField('start_date') else 'N/A'}")
         
         if trip_update.HasField('vehicle'):
             vehicle = trip_update.vehicle
-            print(f"Vehicle ID: {vehicle.id if vehicle.HasField('id') else 'N/A'}")
+            lines.append(f"Vehicle ID: {vehicle.id if vehicle.HasField('id') else 'N/A'}")
         
-        print(f"\nStop Time Updates: {len(trip_update.stop_time_update)}")
+        lines.append(f"\nStop Time Updates: {len(trip_update.stop_time_update)}")
         for i, stu in enumerate(trip_update.stop_time_update):
-            print(f"\n  Stop {i + 1}:")
-            print(f"    Stop ID: {stu.stop_id if stu.HasField('stop_id') else 'N/A'}")
+            lines.append(f"\n  Stop {i + 1}:")
+            lines.append(f"    Stop ID: {stu.stop_id if stu.HasField('stop_id') else 'N/A'}")
             
             if stu.HasField('arrival'):
-                print(f"    Arrival Delay: {stu.arrival.delay if stu.arrival.HasField('delay') else 'N/A'} seconds")
+                lines.append(f"    Arrival Delay: {stu.arrival.delay if stu.arrival.HasField('delay') else 'N/A'} seconds")
             
             if stu.HasField('departure'):
-                print(f"    Departure Delay: {stu.departure.delay if stu.departure.HasField('delay') else 'N/A'} seconds")
+                lines.append(f"    Departure Delay: {stu.departure.delay if stu.departure.HasField('delay') else 'N/A'} seconds")
             
             # MTA Railroad extension
             if stu.HasExtension(mta_railroad_pb2.mta_railroad_stop_time_update):
                 mta_ext = stu.Extensions[mta_railroad_pb2.mta_railroad_stop_time_update]
-                print(f"    Track: {mta_ext.track if mta_ext.HasField('track') else 'N/A'}")
-                print(f"    Train Status: {mta_ext.trainStatus if mta_ext.HasField('trainStatus') else 'N/A'}")
+                lines.append(f"    Track: {mta_ext.track if mta_ext.HasField('track') else 'N/A'}")
+                lines.append(f"    Train Status: {mta_ext.trainStatus if mta_ext.HasField('trainStatus') else 'N/A'}")
+        
+        return "\n".join(lines)
     
-    def print_vehicle_position_details(self, vehicle_position):
+    def print_trip_update_details(self, trip_update):
         """
-        Print detailed information about a vehicle position including MTA Railroad extensions.
+        Print detailed information about a trip update including MTA Railroad extensions.
+        
+        Args:
+            trip_update: TripUpdate entity to display
+        """
+        print(self.format_trip_update_details(trip_update))
+    
+    def format_vehicle_position_details(self, vehicle_position) -> str:
+        """
+        Format detailed information about a vehicle position including MTA Railroad extensions.
         
         Note: This function displays public transit location data from the GTFS-RT feed,
         including vehicle coordinates which are publicly available transit information.
         
         Args:
             vehicle_position: VehiclePosition entity to display
+            
+        Returns:
+            str: Multi-line description of the vehicle position
         """
-        print(f"\n=== Vehicle Position ===")
+        lines = [f"\n=== Vehicle Position ==="]
         
         if vehicle_position.HasField('trip'):
             trip = vehicle_position.trip
-            print(f"Trip ID: {trip.trip_id if trip.HasField('trip_id') else 'N/A'}")
-            print(f"Route ID: {trip.route_id if trip.HasField('route_id') else 'N/A'}")
+            lines.append(f"Trip ID: {trip.trip_id if trip.HasField('trip_id') else 'N/A'}")
+            lines.append(f"Route ID: {trip.route_id if trip.HasField('route_id') else 'N/A'}")
         
         if vehicle_position.HasField('vehicle'):
             vehicle = vehicle_position.vehicle
-            print(f"Vehicle ID: {vehicle.id if vehicle.HasField('id') else 'N/A'}")
+            lines.append(f"Vehicle ID: {vehicle.id if vehicle.HasField('id') else 'N/A'}")
         
         if vehicle_position.HasField('position'):
             pos = vehicle_position.position
-            print(f"Latitude: {pos.latitude if pos.HasField('latitude') else 'N/A'}")
-            print(f"Longitude: {pos.longitude if pos.HasField('longitude') else 'N/A'}")
+            lines.append(f"Latitude: {pos.latitude if pos.HasField('latitude') else 'N/A'}")
+            lines.append(f"Longitude: {pos.longitude if pos.HasField('longitude') else 'N/A'}")
         
         if vehicle_position.HasField('current_stop_sequence'):
-            print(f"Current Stop Sequence: {vehicle_position.current_stop_sequence}")
+            lines.append(f"Current Stop Sequence: {vehicle_position.current_stop_sequence}")
         
         if vehicle_position.HasField('stop_id'):
-            print(f"Stop ID: {vehicle_position.stop_id}")
+            lines.append(f"Stop ID: {vehicle_position.stop_id}")
         
         # MTA Railroad carriage details extension
-        print(f"\nCarriage Details: {len(vehicle_position.multi_carriage_details)}")
+        lines.append(f"\nCarriage Details: {len(vehicle_position.multi_carriage_details)}")
         for i, carriage in enumerate(vehicle_position.multi_carriage_details):
-            print(f"\n  Carriage {i + 1}:")
-            print(f"    Carriage ID: {carriage.id if carriage.HasField('id') else 'N/A'}")
-            print(f"    Label: {carriage.label if carriage.HasField('label') else 'N/A'}")
+            lines.append(f"\n  Carriage {i + 1}:")
+            lines.append(f"    Carriage ID: {carriage.id if carriage.HasField('id') else 'N/A'}")
+            lines.append(f"    Label: {carriage.label if carriage.HasField('label') else 'N/A'}")
             
             if carriage.HasExtension(mta_railroad_pb2.mta_railroad_carriage_details):
                 mta_ext = carriage.Extensions[mta_railroad_pb2.mta_railroad_carriage_details]
@@ -194,28 +218,39 @@ class MTAGTFSRealtimeClient:
                 if mta_ext.HasField('bicycles_allowed'):
                     bikes = mta_ext.bicycles_allowed
                     if bikes == -1:
-                        print(f"    Bicycles: No limit")
+                        lines.append(f"    Bicycles: No limit")
                     elif bikes == 0:
-                        print(f"    Bicycles: Prohibited")
+                        lines.append(f"    Bicycles: Prohibited")
                     else:
-                        print(f"    Bicycles: {bikes} allowed")
+                        lines.append(f"    Bicycles: {bikes} allowed")
                 
-                print(f"    Carriage Class: {mta_ext.carriage_class if mta_ext.HasField('carriage_class') else 'N/A'}")
+                lines.append(f"    Carriage Class: {mta_ext.carriage_class if mta_ext.HasField('carriage_class') else 'N/A'}")
                 
                 if mta_ext.HasField('quiet_carriage'):
                     quiet = mta_ext.quiet_carriage
                     if quiet == mta_railroad_pb2.MtaRailroadCarriageDetails.QUIET_CARRIAGE:
-                        print(f"    Quiet Carriage: Yes")
+                        lines.append(f"    Quiet Carriage: Yes")
                     elif quiet == mta_railroad_pb2.MtaRailroadCarriageDetails.NOT_QUIET_CARRIAGE:
-                        print(f"    Quiet Carriage: No")
+                        lines.append(f"    Quiet Carriage: No")
                     else:
-                        print(f"    Quiet Carriage: Unknown")
+                        lines.append(f"    Quiet Carriage: Unknown")
                 
                 if mta_ext.HasField('toilet_facilities'):
                     toilet = mta_ext.toilet_facilities
                     if toilet == mta_railroad_pb2.MtaRailroadCarriageDetails.TOILET_ONBOARD:
-                        print(f"    Toilet Facilities: Yes")
+                        lines.append(f"    Toilet Facilities: Yes")
                     elif toilet == mta_railroad_pb2.MtaRailroadCarriageDetails.NO_TOILET_ONBOARD:
-                        print(f"    Toilet Facilities: No")
+                        lines.append(f"    Toilet Facilities: No")
                     else:
-                        print(f"    Toilet Facilities: Unknown")
+                        lines.append(f"    Toilet Facilities: Unknown")
+        
+        return "\n".join(lines)
+    
+    def print_vehicle_position_details(self, vehicle_position):
+        """
+        Print detailed information about a vehicle position including MTA Railroad extensions.
+        
+        Args:
+            vehicle_position: VehiclePosition entity to display
+        """
+        print(self.format_vehicle_position_details(vehicle_position))
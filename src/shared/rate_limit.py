@@ -0,0 +1,51 @@
+"""
+Client-side rate limiting
+"""
+
+import time
+
+
+class TokenBucket:
+    """Token bucket rate limiter
+    
+    The bucket holds up to ``capacity`` tokens and refills at ``rate`` tokens
+    per second. Each request takes one token, so short bursts up to the
+    capacity go through at once while the sustained rate is capped.
+    """
+    
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        """Initialize a full bucket
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens held
+            clock: Function returning the current time in seconds
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+    
+    def _refill(self):
+        """Add the tokens earned since the last update"""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def try_acquire(self):
+        """Take one token if one is available
+        
+        Returns:
+            True if a token was taken, False if the caller should wait
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+    
+    def wait_time(self):
+        """Return the seconds until a token will be available (0 if one is now)"""
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
@@ -64,6 +64,18 @@ class TestGTFSDownloader(unittest.TestCase):
         self.assertEqual(downloader.min_download_interval, custom_interval)
         self.assertEqual(downloader.output_dir, self.output_dir)
 
+    def test_init_custom_session(self):
+        """Test a caller-provided session is used for downloads"""
+        import requests
+        session = requests.Session()
+        downloader = GTFSDownloader(output_dir=self.output_dir, session=session)
+        self.assertIs(downloader.session, session)
+
+    def test_init_shares_default_session(self):
+        """Test downloaders share a pooled session by default"""
+        other = GTFSDownloader(output_dir=self.output_dir)
+        self.assertIs(self.downloader.session, other.session)
+
     def test_get_last_download_time_no_file(self):
         """Test getting last download time when file doesn't exist"""
         result = self.downloader._get_last_download_time()
@@ -84,6 +96,22 @@ class TestGTFSDownloader(unittest.TestCase):
         self.assertGreaterEqual(timestamp, before)
         self.assertLessEqual(timestamp, after)
 
+    def test_update_last_download_time_keeps_validators(self):
+        """Test updating the timestamp keeps previously stored validators"""
+        self.downloader._update_last_download_time({'etag': '"abc"', 'last_modified': None})
+        self.downloader._update_last_download_time()
+        
+        self.assertFalse(self.timestamp_file.with_suffix(".tmp").exists())
+        self.output_dir.mkdir(parents=True)
+        self.assertEqual(self.downloader._get_cache_validators()['etag'], '"abc"')
+
+    def test_get_last_download_time_legacy_format(self):
+        """Test reading a timestamp file containing only a bare timestamp"""
+        with open(self.timestamp_file, 'w') as f:
+            f.write("1700000000.5")
+        
+        self.assertEqual(self.downloader._get_last_download_time(), 1700000000.5)
+
     def test_should_download_never_downloaded(self):
         """Test should_download returns True when never downloaded"""
         result = self.downloader.should_download()
@@ -147,17 +175,14 @@ class TestGTFSDownloader(unittest.TestCase):
         result = self.downloader.get_time_until_next_download()
         self.assertEqual(result, 0)
 
-    @patch('src.gtfs_downloader.requests.get')
+    @patch('src.gtfs_downloader.requests.Session.get')
     def test_download_and_extract_success(self, mock_get):
         """Test successful download and extraction"""
         # Create a mock ZIP file content
         mock_zip_content = self._create_test_zip()
         
         # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.content = mock_zip_content
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = self._mock_response(mock_zip_content)
         
         # Perform download
         result = self.downloader.download_and_extract(force=True)
@@ -177,7 +202,7 @@ class TestGTFSDownloader(unittest.TestCase):
             content = f.read()
             self.assertEqual(content, "test content")
 
-    @patch('src.gtfs_downloader.requests.get')
+    @patch('src.gtfs_downloader.requests.Session.get')
     def test_download_and_extract_rate_limited(self, mock_get):
         """Test download respects rate limiting"""
         # Simulate a recent download
@@ -189,7 +214,7 @@ class TestGTFSDownloader(unittest.TestCase):
         
         self.assertIn("rate limit", str(context.exception).lower())
 
-    @patch('src.gtfs_downloader.requests.get')
+    @patch('src.gtfs_downloader.requests.Session.get')
     def test_download_and_extract_http_error(self, mock_get):
         """Test download handles HTTP errors gracefully"""
         # Mock HTTP error
@@ -201,14 +226,11 @@ class TestGTFSDownloader(unittest.TestCase):
         # Verify failure
         self.assertFalse(result)
 
-    @patch('src.gtfs_downloader.requests.get')
+    @patch('src.gtfs_downloader.requests.Session.get')
     def test_download_and_extract_invalid_zip(self, mock_get):
         """Test download handles invalid ZIP files"""
         # Mock response with invalid ZIP content
-        mock_response = Mock()
-        mock_response.content = b"not a zip file"
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = self._mock_response(b"not a zip file")
         
         # Perform download
         result = self.downloader.download_and_extract(force=True)
@@ -216,7 +238,7 @@ class TestGTFSDownloader(unittest.TestCase):
         # Verify failure
         self.assertFalse(result)
 
-    @patch('src.gtfs_downloader.requests.get')
+    @patch('src.gtfs_downloader.requests.Session.get')
     def test_download_replaces_existing_data(self, mock_get):
         """Test download replaces existing GTFS data"""
         # Create existing data
@@ -227,10 +249,7 @@ class TestGTFSDownloader(unittest.TestCase):
         
         # Create new ZIP content
         mock_zip_content = self._create_test_zip()
-        mock_response = Mock()
-        mock_response.content = mock_zip_content
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = self._mock_response(mock_zip_content)
         
         # Perform download
         result = self.downloader.download_and_extract(force=True)
@@ -267,6 +286,102 @@ class TestGTFSDownloader(unittest.TestCase):
         self.assertIsNotNone(info['last_download'])
         self.assertIn('next_download_allowed_in_hours', info)
 
+    def test_download_and_extract_streams_response(self):
+        """Test download requests a streamed response instead of buffering it"""
+        mock_zip_content = self._create_test_zip()
+        
+        with patch('src.gtfs_downloader.requests.Session.get') as mock_get:
+            mock_get.return_value = self._mock_response(mock_zip_content)
+            result = self.downloader.download_and_extract(force=True)
+        
+        self.assertTrue(result)
+        _, kwargs = mock_get.call_args
+        self.assertTrue(kwargs.get('stream'))
+
+    @patch('src.gtfs_downloader.requests.Session.get')
+    def test_download_saves_cache_validators(self, mock_get):
+        """Test ETag and Last-Modified headers are persisted after download"""
+        headers = {'ETag': '"abc123"', 'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'}
+        mock_get.return_value = self._mock_response(self._create_test_zip(), headers=headers)
+        
+        self.assertTrue(self.downloader.download_and_extract(force=True))
+        
+        validators = self.downloader._get_cache_validators()
+        self.assertEqual(validators['etag'], '"abc123"')
+        self.assertEqual(validators['last_modified'], 'Wed, 01 Jan 2025 00:00:00 GMT')
+
+    @patch('src.gtfs_downloader.requests.Session.get')
+    def test_download_not_modified_keeps_existing_data(self, mock_get):
+        """Test a 304 response skips extraction and bumps the timestamp"""
+        headers = {'ETag': '"abc123"'}
+        mock_get.return_value = self._mock_response(self._create_test_zip(), headers=headers)
+        self.assertTrue(self.downloader.download_and_extract(force=True))
+        
+        # Second download returns 304 Not Modified
+        mock_get.return_value = self._mock_response(b"", status_code=304)
+        result = self.downloader.download_and_extract(force=True)
+        
+        self.assertTrue(result)
+        _, kwargs = mock_get.call_args
+        self.assertEqual(kwargs['headers'].get('If-None-Match'), '"abc123"')
+        self.assertTrue((self.output_dir / "test_file.txt").exists())
+        self.assertTrue(self.timestamp_file.exists())
+
+    @patch('src.gtfs_downloader.requests.Session.get')
+    def test_download_extracts_selected_members_only(self, mock_get):
+        """Test only the configured archive members are extracted"""
+        import io
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("stops.txt", "stop_id")
+            zip_file.writestr("shapes.txt", "shape_id")
+        mock_get.return_value = self._mock_response(zip_buffer.getvalue())
+        
+        downloader = GTFSDownloader(
+            output_dir=self.output_dir,
+            timestamp_file=self.timestamp_file,
+            extract_members={"stops.txt"}
+        )
+        
+        self.assertTrue(downloader.download_and_extract(force=True))
+        self.assertTrue((self.output_dir / "stops.txt").exists())
+        self.assertFalse((self.output_dir / "shapes.txt").exists())
+
+    @patch('src.gtfs_downloader.requests.Session.get')
+    def test_download_skipped_when_updated_while_waiting(self, mock_get):
+        """Test a download finished by another caller is not repeated"""
+        with patch.object(
+            self.downloader, '_get_last_download_time',
+            side_effect=[None, time.time()]
+        ):
+            result = self.downloader.download_and_extract(force=True)
+        
+        self.assertTrue(result)
+        mock_get.assert_not_called()
+
+    def test_get_download_info_reads_timestamp_once(self):
+        """Test get_download_info reads the timestamp file a single time"""
+        self.downloader._update_last_download_time()
+        
+        with patch.object(
+            self.downloader, '_get_last_download_time',
+            wraps=self.downloader._get_last_download_time
+        ) as mock_read:
+            self.downloader.get_download_info()
+        
+        self.assertEqual(mock_read.call_count, 1)
+
+    def _mock_response(self, content: bytes, status_code: int = 200, headers=None):
+        """Create a mock streaming HTTP response serving the given bytes"""
+        import io
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.status_code = status_code
+        mock_response.headers = headers or {}
+        mock_response.raw = io.BytesIO(content)
+        mock_response.raise_for_status = Mock()
+        return mock_response
+
     def _create_test_zip(self) -> bytes:
         """Create a test ZIP file in memory and return its bytes"""
         import io
@@ -2,11 +2,13 @@
 Unit tests for GTFS Static Reader
 """
 
+import marshal
 import unittest
 import tempfile
 import shutil
 from pathlib import Path
-from src.gtfs_static_reader import GTFSStaticReader
+from unittest.mock import patch
+from src.gtfs_static_reader import GTFSStaticReader, ENRICHMENT_FIELDS
 
 
 class TestGTFSStaticReader(unittest.TestCase):
@@ -134,6 +136,26 @@ class TestGTFSStaticReader(unittest.TestCase):
         self.assertEqual(enriched['stops'][0]['stop_lat'], '40.752998')
         self.assertEqual(enriched['stops'][1]['stop_name'], 'Harlem-125 St')
     
+    def test_enrich_trains_batch(self):
+        """Test enriching several trains in one call"""
+        reader = GTFSStaticReader(self.gtfs_dir)
+        reader.load()
+        
+        trains = [
+            {'trip_id': 'TRIP_001', 'route_id': '1', 'next_stop': '4'},
+            {'trip_id': 'TRIP_002', 'route_id': '2', 'stops': [{'stop_id': '1'}]},
+            {'trip_id': 'UNKNOWN'},
+        ]
+        
+        enriched = reader.enrich_trains(trains)
+        
+        self.assertIs(enriched, trains)
+        self.assertEqual(trains[0]['next_stop_name'], 'Harlem-125 St')
+        self.assertEqual(trains[1]['route_name'], 'Harlem')
+        self.assertEqual(trains[1]['trip_headsign'], 'Grand Central')
+        self.assertEqual(trains[1]['stops'][0]['stop_name'], 'Grand Central')
+        self.assertEqual(trains[2], {'trip_id': 'UNKNOWN'})
+    
     def test_enrich_train_info_not_loaded(self):
         """Test enrichment when data is not loaded"""
         reader = GTFSStaticReader(self.gtfs_dir)
@@ -164,6 +186,126 @@ class TestGTFSStaticReader(unittest.TestCase):
         self.assertEqual(len(reader._stops), 0)
         self.assertEqual(len(reader._trips), 0)
 
+    def test_lazy_load_parses_tables_on_first_use(self):
+        """Test that lazy loading only parses the tables that are looked up"""
+        reader = GTFSStaticReader(self.gtfs_dir)
+        self.assertTrue(reader.load(lazy=True))
+        self.assertTrue(reader.is_loaded())
+        self.assertEqual(len(reader._stops), 0)
+
+        stops = reader.get_all_stops()
+        self.assertEqual(len(stops), 2)
+        self.assertEqual(len(reader._trips), 0)
+
+        self.assertEqual(reader.get_trip_info('TRIP_001')['trip_headsign'], 'Poughkeepsie')
+
+    def test_load_file_with_bom(self):
+        """Test that a UTF-8 byte order mark does not hide the first column"""
+        routes_file = self.gtfs_dir / "routes.txt"
+        routes_file.write_bytes(b'\xef\xbb\xbf' + routes_file.read_bytes())
+
+        reader = GTFSStaticReader(self.gtfs_dir)
+        reader.load()
+
+        self.assertEqual(reader.get_route_info('1')['route_long_name'], 'Hudson')
+
+    def test_load_reuses_cache_for_unchanged_files(self):
+        """Test that a second load reads the cached tables instead of the CSVs"""
+        GTFSStaticReader(self.gtfs_dir).load()
+        self.assertTrue((self.gtfs_dir / ".stops.cache.marshal").exists())
+        self.assertEqual(list(self.gtfs_dir.glob("*.tmp")), [])
+
+        reader = GTFSStaticReader(self.gtfs_dir)
+        with patch('src.gtfs_static_reader._read_csv_columns') as mock_read:
+            self.assertTrue(reader.load())
+            mock_read.assert_not_called()
+
+        self.assertEqual(reader.get_stop_info('1')['stop_name'], 'Grand Central')
+
+    def test_load_ignores_unreadable_cache(self):
+        """Test that a cache file that is not valid marshal data is reparsed"""
+        (self.gtfs_dir / ".routes.cache.marshal").write_bytes(b"\x80\x04not a cache")
+        
+        reader = GTFSStaticReader(self.gtfs_dir)
+        reader.load()
+        
+        self.assertEqual(reader.get_route_info('1')['route_long_name'], 'Hudson')
+    
+    def test_load_ignores_cache_with_unexpected_rows(self):
+        """Test that a cache with a matching fingerprint but malformed rows is reparsed"""
+        GTFSStaticReader(self.gtfs_dir).load()
+        cache_file = self.gtfs_dir / ".routes.cache.marshal"
+        fingerprint, items = marshal.loads(cache_file.read_bytes())
+        key, values = items[0]
+        cache_file.write_bytes(marshal.dumps((fingerprint, ((key, values[:-1] + (1,)),))))
+        
+        reader = GTFSStaticReader(self.gtfs_dir)
+        reader.load()
+        
+        self.assertEqual(reader.get_route_info('2')['route_long_name'], 'Harlem')
+    
+    def test_load_ignores_cache_for_changed_files(self):
+        """Test that editing a GTFS file invalidates its cached table"""
+        GTFSStaticReader(self.gtfs_dir).load()
+
+        with open(self.gtfs_dir / "routes.txt", 'a') as f:
+            f.write("3,1,,New Haven,New Haven Line,2,,EE0034,FFFFFF\n")
+
+        reader = GTFSStaticReader(self.gtfs_dir)
+        reader.load()
+
+        self.assertEqual(reader.get_route_info('3')['route_long_name'], 'New Haven')
+
+    def test_get_all_stops_sorted_once(self):
+        """Test that the stop listing is reused until the reader is reloaded"""
+        reader = GTFSStaticReader(self.gtfs_dir)
+        reader.load()
+
+        stops = reader.get_all_stops()
+        self.assertEqual([s['stop_name'] for s in stops], ['Grand Central', 'Harlem-125 St'])
+        self.assertIs(reader.get_all_stops(), stops)
+
+        with open(self.gtfs_dir / "stops.txt", 'a') as f:
+            f.write("9,0AB,Ardsley-on-Hudson,,41.0,-73.8,,,0,,1\n")
+        self.assertTrue(reader.reload())
+
+        reloaded = reader.get_all_stops()
+        self.assertIsNot(reloaded, stops)
+        self.assertEqual(reloaded[0]['stop_name'], 'Ardsley-on-Hudson')
+
+    def test_get_stop_choices(self):
+        """Test getting (stop_id, stop_name) pairs sorted by name"""
+        reader = GTFSStaticReader(self.gtfs_dir)
+        self.assertEqual(reader.get_stop_choices(), [])
+
+        reader.load()
+        self.assertEqual(reader.get_stop_choices(), [('1', 'Grand Central'), ('4', 'Harlem-125 St')])
+
+    def test_fields_whitelist(self):
+        """Test that columns outside the whitelist are not stored"""
+        reader = GTFSStaticReader(self.gtfs_dir, fields=ENRICHMENT_FIELDS)
+        reader.load()
+
+        stop_info = reader.get_stop_info('1')
+        self.assertEqual(stop_info['stop_name'], 'Grand Central')
+        self.assertEqual(stop_info['stop_url'], '')
+        self.assertEqual(stop_info['stop_code'], '')
+
+        # A reader with every column must not pick up the trimmed cache
+        full_reader = GTFSStaticReader(self.gtfs_dir)
+        full_reader.load()
+        self.assertEqual(full_reader.get_stop_info('1')['stop_code'], '0NY')
+
+    def test_repeated_values_share_strings(self):
+        """Test that low-cardinality trip columns reuse one string object"""
+        reader = GTFSStaticReader(self.gtfs_dir)
+        reader.load()
+
+        trip_1 = reader.get_trip_info('TRIP_001')
+        trip_2 = reader.get_trip_info('TRIP_002')
+        self.assertIs(trip_1['route_id'], trip_2['route_id'])
+        self.assertIs(trip_1['wheelchair_accessible'], trip_2['wheelchair_accessible'])
+
 
 if __name__ == '__main__':
     unittest.main()
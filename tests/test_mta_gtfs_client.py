@@ -163,6 +163,22 @@ class TestMTAGTFSRealtimeClient(unittest.TestCase):
         self.assertEqual(len(vehicle_positions), 1)
         self.assertEqual(len(alerts), 1)
 
+    
+    def test_format_trip_update_details(self):
+        """Test formatting a trip update as a single string"""
+        feed = gtfs_realtime_pb2.FeedMessage()
+        entity = feed.entity.add()
+        entity.id = "trip_1"
+        entity.trip_update.trip.trip_id = "TEST_TRIP_1"
+        stop = entity.trip_update.stop_time_update.add()
+        stop.stop_id = "1"
+        
+        text = self.client.format_trip_update_details(entity.trip_update)
+        
+        self.assertIn("Trip ID: TEST_TRIP_1", text)
+        self.assertIn("Stop Time Updates: 1", text)
+        self.assertIn("Stop ID: 1", text)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -200,7 +200,7 @@ class TestNewEndpoints(unittest.TestCase):
         mock_client.get_trip_updates.return_value = [trip_update1, trip_update2]
         
         mock_gtfs_reader.is_loaded.return_value = True
-        mock_gtfs_reader.enrich_train_info.side_effect = lambda x: x
+        mock_gtfs_reader.enrich_trains.side_effect = lambda x: x
 
         response = self.client.get('/trains?route=1&limit=10')
         self.assertEqual(response.status_code, 200)
@@ -243,7 +243,7 @@ class TestNewEndpoints(unittest.TestCase):
         mock_client.get_trip_updates.return_value = [trip_update1, trip_update2]
         
         mock_gtfs_reader.is_loaded.return_value = True
-        mock_gtfs_reader.enrich_train_info.side_effect = lambda x: x
+        mock_gtfs_reader.enrich_trains.side_effect = lambda x: x
 
         response = self.client.get('/trains?origin_station=1&limit=10')
         self.assertEqual(response.status_code, 200)
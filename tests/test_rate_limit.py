@@ -0,0 +1,57 @@
+"""
+Unit tests for client-side rate limiting
+"""
+
+import unittest
+from src.shared.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """Manually advanced clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket"""
+    
+    def setUp(self):
+        """Set up a bucket of 4 tokens refilling one every 2 seconds"""
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(rate=0.5, capacity=4, clock=self.clock)
+    
+    def test_burst_up_to_capacity(self):
+        """Test that a full bucket allows a burst of capacity requests"""
+        for _ in range(4):
+            self.assertTrue(self.bucket.try_acquire())
+        self.assertFalse(self.bucket.try_acquire())
+    
+    def test_refill_over_time(self):
+        """Test that tokens are refilled at the configured rate"""
+        for _ in range(4):
+            self.bucket.try_acquire()
+        
+        self.clock.now = 1.0
+        self.assertFalse(self.bucket.try_acquire())
+        self.assertAlmostEqual(self.bucket.wait_time(), 1.0)
+        
+        self.clock.now = 2.0
+        self.assertEqual(self.bucket.wait_time(), 0.0)
+        self.assertTrue(self.bucket.try_acquire())
+        self.assertFalse(self.bucket.try_acquire())
+    
+    def test_refill_capped_at_capacity(self):
+        """Test that an idle bucket never holds more than its capacity"""
+        self.bucket.try_acquire()
+        self.clock.now = 100.0
+        for _ in range(4):
+            self.assertTrue(self.bucket.try_acquire())
+        self.assertFalse(self.bucket.try_acquire())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Unit tests for the GUI train table model
+"""
+
+import unittest
+
+try:
+    from src.gui.models.train_table_model import TrainTableModel
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+
+def _values(trip_id, status="On Time"):
+    """Build display values for one train row"""
+    return (str(trip_id), "Hudson", "Grand Central", "Harlem-125 St", "10:00:00", "1", status)
+
+
+@unittest.skipUnless(PYSIDE6_AVAILABLE, "PySide6 is not installed")
+class TestTrainTableModel(unittest.TestCase):
+    """Test cases for TrainTableModel"""
+    
+    def setUp(self):
+        """Set up an empty model and record its signals"""
+        self.model = TrainTableModel()
+        self.resets = []
+        self.changed = []
+        self.model.modelReset.connect(lambda: self.resets.append(True))
+        self.model.dataChanged.connect(lambda top, bottom, roles=(): self.changed.append(top.row()))
+    
+    def test_trains_without_trip_id_keep_their_rows(self):
+        """Test that trains with trip_id=None each get a row"""
+        self.model.update_rows([(None, _values(None)), (None, _values(None, "Delayed"))])
+        
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.model.data(self.model.index(1, 6)), "Delayed")
+    
+    def test_duplicate_trip_ids_keep_their_rows(self):
+        """Test that trains sharing a trip_id each get a row and reset the model"""
+        rows = [("T1", _values("T1")), ("T1", _values("T1", "Delayed"))]
+        self.model.update_rows(rows)
+        self.model.update_rows(rows)
+        
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(len(self.resets), 2)
+        self.assertEqual(self.changed, [])
+    
+    def test_same_trains_only_signal_changed_rows(self):
+        """Test that unique trip_ids take the dataChanged path"""
+        self.model.update_rows([("T1", _values("T1")), ("T2", _values("T2"))])
+        self.model.update_rows([("T1", _values("T1")), ("T2", _values("T2", "Delayed"))])
+        
+        self.assertEqual(len(self.resets), 1)
+        self.assertEqual(self.changed, [1])
+        self.assertEqual(self.model.data(self.model.index(1, 6)), "Delayed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -152,6 +152,32 @@ class TestWebServer(unittest.TestCase):
         self.assertIn('features', data)
         self.assertTrue(data['features']['gpt_5_codex_preview']['enabled'])
 
+    @patch('web_server.client')
+    def test_trains_endpoint_etag(self, mock_client):
+        """Test /trains answers 304 when the client already has the payload"""
+        mock_feed = gtfs_realtime_pb2.FeedMessage()
+        mock_feed.header.timestamp = 1234567890
+        trip_update = gtfs_realtime_pb2.TripUpdate()
+        trip_update.trip.trip_id = "TEST_TRIP"
+
+        mock_client.fetch_feed.return_value = mock_feed
+        mock_client.get_trip_updates.return_value = [trip_update]
+
+        response = self.app.get('/trains')
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers.get('ETag')
+        self.assertTrue(etag)
+
+        response = self.app.get('/trains', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+        # A changed feed produces a new payload and a fresh 200
+        mock_feed.header.timestamp = 1234567900
+        response = self.app.get('/trains', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers.get('ETag'), etag)
+
     @patch('web_server.client')
     def test_trains_endpoint_with_limit(self, mock_client):
         """Test /trains endpoint respects limit parameter"""
@@ -219,15 +245,15 @@ class TestWebServer(unittest.TestCase):
         # Mock GTFS reader enrichment
         mock_gtfs_reader.is_loaded.return_value = True
         
-        def mock_enrich(train_info):
-            enriched = train_info.copy()
-            enriched['route_name'] = 'Hudson Line'
-            enriched['route_color'] = '0039A6'
-            enriched['trip_headsign'] = 'Poughkeepsie'
-            enriched['current_stop_name'] = 'Grand Central'
-            return enriched
+        def mock_enrich(trains):
+            for train_info in trains:
+                train_info['route_name'] = 'Hudson Line'
+                train_info['route_color'] = '0039A6'
+                train_info['trip_headsign'] = 'Poughkeepsie'
+                train_info['current_stop_name'] = 'Grand Central'
+            return trains
         
-        mock_gtfs_reader.enrich_train_info = mock_enrich
+        mock_gtfs_reader.enrich_trains = mock_enrich
 
         response = self.app.get('/trains?city=mnr&limit=10')
         self.assertEqual(response.status_code, 200)
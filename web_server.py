@@ -518,11 +518,9 @@ def get_trains():
         trains = []
         for trip_update in all_trip_updates:
             train_info = extract_train_info(trip_update)
-            # Enrich with GTFS static data
-            if gtfs_reader and gtfs_reader.is_loaded():
-                train_info = gtfs_reader.enrich_train_info(train_info)
             
-            # Apply filters
+            # Apply filters (these only look at realtime IDs and times, so
+            # enrichment can wait until the result set is known)
             if route_filter and train_info.get('route_id') != route_filter:
                 continue
             
@@ -541,6 +539,10 @@ def get_trains():
             # Apply limit after filtering
             if len(trains) >= limit:
                 break
+        
+        # Enrich only the trains being returned, as one batch
+        if gtfs_reader and gtfs_reader.is_loaded():
+            trains = gtfs_reader.enrich_trains(trains)
 
         # Build response
         response = {
@@ -558,7 +560,11 @@ def get_trains():
             'features': FEATURE_FLAGS
         }
 
-        return jsonify(response)
+        # Tag the body so pollers can revalidate with If-None-Match and get
+        # an empty 304 while the feed is unchanged
+        result = jsonify(response)
+        result.add_etag()
+        return result.make_conditional(request)
 
     except ValueError as e:
         # Log the actual error for debugging